@@ -23,6 +23,7 @@ setup(
         'cookiecutter==2.6.0',
         'idna==3.10',
         'Jinja2==3.1.6',
+        'lxml==6.0.0',
         'markdown-it-py==3.0.0',
         'MarkupSafe==3.0.2',
         'mdurl==0.1.2',
@@ -37,6 +38,9 @@ setup(
         'typing_extensions==4.14.0',
         'urllib3==2.5.0',
     ],
+    extras_require={
+        're2': ['google-re2'],
+    },
     entry_points={
         'console_scripts': [
             'transpile=transpilex.main:main',
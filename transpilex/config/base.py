@@ -9,7 +9,7 @@ PHP_EXTENSION = '.php'
 PHP_GULP_ASSETS_PATH = './src/assets'
 
 # Laravel
-LARAVEL_INSTALLER_COMMAND = 'composer global require laravel/installer'
+LARAVEL_INSTALLER_COMMAND = ['composer', 'global', 'require', 'laravel/installer']
 LARAVEL_PROJECT_CREATION_COMMAND = 'laravel new'
 LARAVEL_PROJECT_CREATION_COMMAND_AUTH = ['git', 'clone',
                                          'https://github.com/transpilex/laravel-boilerplate-with-auth.git', '.']
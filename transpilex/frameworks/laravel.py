@@ -1,10 +1,25 @@
+import os
 import re
+import mmap
 import json
 import shutil
 import html
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+try:
+    import re2  # google-re2: linear-time matching, no catastrophic backtracking
+except ImportError:
+    re2 = None
 
 from transpilex.config.base import LARAVEL_DESTINATION_FOLDER, LARAVEL_ASSETS_FOLDER, \
     LARAVEL_EXTENSION, LARAVEL_RESOURCES_PRESERVE, LARAVEL_AUTH_FOLDER, LARAVEL_INSTALLER_COMMAND, \
@@ -19,9 +34,404 @@ from transpilex.helpers.package_json import sync_package_json
 from transpilex.helpers.restructure_files import restructure_files
 from transpilex.helpers.validations import folder_exists
 
+# Escapes backslashes and single quotes for PHP single-quoted strings in one pass
+_BLADE_STR_ESCAPE = str.maketrans({'\\': '\\\\', "'": "\\'"})
+
+
+def _default_fmt(key, value):
+    return f"'{key}' => '{str(value).translate(_BLADE_STR_ESCAPE)}'"
+
+
+# Blade array entry formatters keyed on the exact value type; type() keeps bool apart from int
+_FORMATTERS = {
+    str: lambda k, v: f"'{k}' => '{v.translate(_BLADE_STR_ESCAPE)}'",
+    bool: lambda k, v: f"'{k}' => {'true' if v else 'false'}",
+    int: lambda k, v: f"'{k}' => {v}",
+    float: lambda k, v: f"'{k}' => {v}",
+}
+
+
+def _format_params(items):
+    return ", ".join(_FORMATTERS.get(type(value), _default_fmt)(key, value) for key, value in items)
+
+
+@lru_cache(maxsize=4096)
+def _format_params_cached(typed_items):
+    # The value type is part of the key so True and 1 (equal and same hash) never share an entry
+    return _format_params((key, value) for key, _, value in typed_items)
+
+
+# Kept on a single line without flags so the same pattern compiles with both re2 and re
+_INCLUDE_PATTERN = r'''@@include\(\s*["'](?P<path>[^"']+)["'](?:\s*,\s*(?P<params>\{[\s\S]*?\}|array\([\s\S]*?\)))?\s*\)'''
+
+_INCLUDE_RE = re2.compile(_INCLUDE_PATTERN) if re2 else re.compile(_INCLUDE_PATTERN)
+
+# Anything on a full page that needs the tree: tags moved to the styles/scripts sections,
+# includes, the content marker and the document wrapper
+_PAGE_MARKUP_RE = re.compile(r'<(?:link|script|head|body|html|!doctype)\b|@@include|data-content', re.IGNORECASE)
+
+# BS4 backend for full pages: the C-based lxml parser, or the stdlib one when lxml is missing
+_PAGE_PARSER = 'lxml' if lxml else 'html.parser'
+
+# Full pages only ever read their links, scripts and body; everything else is skipped at parse time.
+# html.parser never adds a <body>, so on a page without one the strainer would also drop the
+# [data-content] element; that parser gets the whole tree instead
+_PAGE_STRAINER = SoupStrainer(["link", "script", "body"]) if lxml else None
+
+# What the no-body fallback strips from the raw page in one pass: the head, the tags already
+# moved to the styles/scripts sections, and the document wrapper tags
+_FALLBACK_STRIP_RE = re.compile(
+    r'<head\b[^>]*>[\s\S]*?</head\s*>'
+    r'|<script\b[^>]*>[\s\S]*?</script\s*>'
+    r'|<link\b[^>]*>'
+    r'|<!DOCTYPE[^>]*>'
+    r'|</?(?:html|body|head)\b[^>]*>',
+    re.IGNORECASE
+)
+
+# Needs a backreference and a lookahead, neither of which re2 supports
+_HREF_RE = re.compile(r'''href\s*=\s*(['"])(?!http|#|javascript:)([^'"]+?\.html)\1''', re.IGNORECASE)
+
+_PARTIAL_VAR_RE = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
+
+_PHP_ARRAY_RE = re.compile(r'array\s*\(([\s\S]*)\)')
+
+_PARAM_PATTERN = re.compile(r"""
+    (?:['"](?P<key>[^'"]+)['"]\s*=>\s*)?
+    (?:
+        ['"](?P<sval>(?:\\.|[^'"])*)['"] |
+        (?P<nval>-?\d+(?:\.\d+)?) |
+        (?P<bool>true|false)
+    )
+    \s*(?:,\s*|$)
+""", re.VERBOSE | re.DOTALL)
+
+# Backslash escapes understood in PHP array string values, resolved in one pass
+_PHP_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
+_PHP_ESCAPE_RE = re.compile(r'\\([ntr\\"\'])')
+
+_VITE_INPUT_RE = re.compile(r"input\s*:\s*\[[\s\S]*?\]", re.DOTALL)
+
+_VITE_LARAVEL_PLUGIN_RE = re.compile(r"(laravel\s*\(\s*\{)", re.DOTALL)
+
+# States for the single-pass JSON-ish sanitizer
+NORMAL = 0
+IN_STRING_SQ = 1
+IN_STRING_DQ = 2
+IN_LINE_COMMENT = 3
+IN_BLOCK_COMMENT = 4
+
+_STRING_SPECIAL_RE = re.compile(r'[\'"\\\s]')
+
+
+def _sanitize_json_ish(s: str) -> str:
+    """
+    Turns a loose JS object literal into strict JSON in a single pass.
+    Drops // and /* */ comments, converts single-quoted strings to double-quoted,
+    normalizes whitespace inside string values, quotes bare keys and drops trailing commas.
+    """
+    out = []
+    buf = []  # content of the string literal being read
+    state = NORMAL
+    commas = []  # indexes in `out` of a comma run followed only by whitespace so far
+    i, n = 0, len(s)
+
+    while i < n:
+        c = s[i]
+
+        if state == NORMAL:
+            if c == '"' or c == "'":
+                state = IN_STRING_DQ if c == '"' else IN_STRING_SQ
+                buf = []
+                commas = []
+            elif c == '/' and i + 1 < n and s[i + 1] == '/':
+                state = IN_LINE_COMMENT
+                i += 1
+            elif c == '/' and i + 1 < n and s[i + 1] == '*':
+                state = IN_BLOCK_COMMENT
+                i += 1
+            elif c.isspace():
+                out.append(c)
+            elif c in '}]':
+                # Drop a trailing comma run (comments in between were never emitted)
+                for j in commas:
+                    out[j] = ''
+                commas = []
+                out.append(c)
+            elif c == ',':
+                commas.append(len(out))
+                out.append(c)
+            elif c.isalpha() or c == '_':
+                # Bare word: quote it when it is used as a key
+                j = i + 1
+                while j < n and (s[j].isalnum() or s[j] in '_-'):
+                    j += 1
+                k = j
+                while k < n and s[k].isspace():
+                    k += 1
+                word = s[i:j]
+                out.append(f'"{word}"' if k < n and s[k] == ':' else word)
+                commas = []
+                i = j
+                continue
+            else:
+                out.append(c)
+                commas = []
+
+        elif state == IN_LINE_COMMENT:
+            # Jump to the end of the line, the newline itself is kept
+            j = s.find('\n', i)
+            if j == -1:
+                break
+            out.append('\n')
+            state = NORMAL
+            i = j
+
+        elif state == IN_BLOCK_COMMENT:
+            j = s.find('*/', i)
+            if j == -1:
+                break
+            state = NORMAL
+            i = j + 1
+
+        else:
+            # Copy the run of ordinary characters up to the next quote, backslash or whitespace in one slice
+            m = _STRING_SPECIAL_RE.search(s, i)
+            j = m.start() if m else n
+            if j > i:
+                buf.append(s[i:j])
+                i = j
+                continue
+
+            quote = '"' if state == IN_STRING_DQ else "'"
+            if c == quote:
+                out.append(f'"{"".join(buf).strip()}"')
+                state = NORMAL
+            elif c == '\\' and i + 1 < n:
+                nxt = s[i + 1]
+                # \' is not a valid JSON escape
+                buf.append("'" if nxt == "'" else c + nxt)
+                i += 1
+            elif c == '"':
+                buf.append('\\"')
+            elif c.isspace():
+                # Newlines/tabs become a space, runs of whitespace collapse into one
+                j = i + 1
+                while j < n and s[j].isspace():
+                    j += 1
+                buf.append(' ' if j - i > 1 or c in '\n\r\t' else c)
+                i = j
+                continue
+            else:
+                buf.append(c)
+
+        i += 1
+
+    if state in (IN_STRING_SQ, IN_STRING_DQ):
+        # Unterminated string, emit as-is and let the JSON parser report it
+        out.append(('"' if state == IN_STRING_DQ else "'") + "".join(buf))
+
+    return "".join(out)
+
+
+def _iter_html(root):
+    """
+    Yields the names of all *.html files under root, reading entry types from the
+    directory listing instead of stat-ing every path.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                yield from _iter_html(e.path)
+            elif e.name.endswith('.html'):
+                yield e.name
+
+
+def _strip_src_prefix(src: str) -> str:
+    """
+    Drops the leading '/' segments of a script src, each optionally preceded by a run of
+    './' or '../' (so '/x', '//x' and './/x' lose their prefix, './x' and '../x' keep it).
+    """
+    # Most srcs start with a folder name and need no prefix walk
+    if not src.startswith(('.', '/')):
+        return src
+    while True:
+        j = 0
+        while True:
+            if src.startswith('./', j):
+                j += 2
+            elif src.startswith('../', j):
+                j += 3
+            else:
+                break
+        if not src.startswith('/', j):
+            return src
+        src = src[j + 1:]
+
+
+# Third-party script folders that are never bundled through Vite
+_EXCLUDED_ASSETS = ('assets/js/vendor/', 'assets/js/libs/', 'assets/js/plugins/')
+_EXCLUDED_JS = ('js/vendor/', 'js/libs/', 'js/plugins/')
+_APP_JS = ('js/', 'scripts/')
+
+
+def _vite_src(src_attr: str) -> str:
+    """
+    Returns the resources/ path Vite should bundle a script src as, or '' when the
+    script tag is kept as-is (vendor/libs/plugins and anything outside the app's js).
+    """
+    normalized_src_attr = _strip_src_prefix(src_attr)
+    if normalized_src_attr.startswith('assets/js/') and not normalized_src_attr.startswith(_EXCLUDED_ASSETS):
+        return normalized_src_attr.replace("assets/", "resources/", 1)
+    if normalized_src_attr.startswith(_APP_JS) and not normalized_src_attr.startswith(_EXCLUDED_JS):
+        return "resources/" + normalized_src_attr
+    return ""
+
+
+def _strip_page_source(content: str) -> str:
+    """
+    Content section for pages without a <body>: the source text minus the head,
+    the moved link/script tags and the document wrapper tags.
+    """
+    return _FALLBACK_STRIP_RE.sub('', content)
+
+
+def _lxml_tag_html(el) -> str:
+    return lxml.html.tostring(el, encoding="unicode", with_tail=False)
+
+
+def _lxml_inner_html(el) -> str:
+    """
+    lxml counterpart of BS4's decode_contents(): the element's text and children, serialized.
+    """
+    return html.escape(el.text or "", quote=False) + "".join(
+        lxml.html.tostring(child, encoding="unicode") for child in el)
+
+
+_TITLE_INCLUDES = {"title-meta.html", "app-meta-title.html"}
+
+# Same shape as the generic include pattern, but only matches title includes
+_TITLE_INCLUDE_RE = re.compile(
+    r"""@@include\(
+              \s*["'](?P<path>(?:[^"']*/)?(?i:(?:title-meta|app-meta-title)\.html))["']
+              (?:\s*,\s*(?P<params>\{[\s\S]*?\}|array\([\s\S]*?\)))?
+              \s*\)""",
+    re.VERBOSE
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_title_include(inc_path_str: str) -> bool:
+    return Path(inc_path_str).name.lower() in _TITLE_INCLUDES
+
+
+@lru_cache(maxsize=4096)
+def _blade_path_for(inc_path_str: str) -> str:
+    """
+    Converts an include path into a dotted Blade view name, e.g. './partials/page-title.html' -> 'partials.page-title'.
+    """
+    return (
+        Path(inc_path_str)
+        .with_suffix('')
+        .as_posix()
+        .lstrip('./')
+        .replace('/', '.')
+    )
+
+
+def _iter_views(root, skip_dirs=(), rel=""):
+    """
+    Yields (path, path relative to the starting root) for the *.php files under root,
+    in sorted order so reads and writes touch neighbouring entries consecutively.
+    Entry types come from the directory listing instead of stat-ing every path.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        entries = sorted(it, key=lambda e: e.name)
+    for e in entries:
+        if e.is_dir(follow_symlinks=False):
+            if e.name not in skip_dirs:
+                yield from _iter_views(e.path, skip_dirs, os.path.join(rel, e.name))
+        elif e.name.endswith(".php") and e.is_file(follow_symlinks=False):
+            yield e.path, os.path.join(rel, e.name)
+
+
+# Fixed RoutingController and routes/web.php sources, already stripped and newline-terminated
+_ROUTING_CONTROLLER_SOURCE = r"""<?php
+
+namespace App\Http\Controllers;
+
+use Illuminate\Support\Facades\Auth;
+use Illuminate\Http\Request;
+
+class RoutingController extends Controller
+{
+
+    public function index(Request $request)
+    {
+        return view('index');
+    }
+
+    public function root(Request $request, $first)
+    {
+        return view($first);
+    }
+
+    public function secondLevel(Request $request, $first, $second)
+    {
+        return view($first . '.' . $second);
+    }
+
+    public function thirdLevel(Request $request, $first, $second, $third)
+    {
+        return view($first . '.' . $second . '.' . $third);
+    }
+}
+"""
+
+_ROUTES_WEB_SOURCE = r"""<?php
+
+use Illuminate\Support\Facades\Route;
+use App\Http\Controllers\RoutingController;
+
+Route::group(['prefix' => '/'], function () {
+    Route::get('', [RoutingController::class, 'index'])->name('root');
+    Route::get('{first}/{second}/{third}', [RoutingController::class, 'thirdLevel'])->name('third');
+    Route::get('{first}/{second}', [RoutingController::class, 'secondLevel'])->name('second');
+    Route::get('{any}', [RoutingController::class, 'root'])->name('any');
+});
+"""
+
+
+# Converter each worker process converts its share of views with, set once per process
+_worker_converter = None
+
+
+def _init_worker(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_one(view):
+    """
+    Converts one (path, relative path) view in a worker process and returns the
+    log message along with the Vite inputs it collected, for the parent to merge.
+    """
+    _worker_converter.vite_inputs = set()
+    message = _worker_converter._convert_file(*view)
+    return message, _worker_converter.vite_inputs
+
 
 class LaravelConverter:
-    def __init__(self, project_name: str, source_path: str, assets_path: str, auth: bool = False):
+    def __init__(self, project_name: str, source_path: str, assets_path: str, auth: bool = False,
+                 use_hardlinks: bool = True):
         self.project_name = project_name
         self.source_path = Path(source_path)
         self.destination_path = Path(LARAVEL_DESTINATION_FOLDER)
@@ -38,12 +448,15 @@ class LaravelConverter:
         self.project_vite_path = Path(self.project_root / "vite.config.js")
 
         self.ROUTE_STRICT = True  # only change routes when exact match exists
+        self.RAW_LXML = lxml is not None  # split full pages on the raw lxml.html tree instead of BeautifulSoup
         self.href_route_index = self._build_route_index()
 
         self.vite_inputs = set()
 
         self.auth_required = auth
 
+        self.use_hardlinks = use_hardlinks
+
         self.create_project()
 
     def create_project(self):
@@ -75,11 +488,19 @@ class LaravelConverter:
 
         else:
             try:
-                subprocess.run(LARAVEL_INSTALLER_COMMAND, shell=True, check=True)
+                # The installer only has to be fetched once, skip the network round trip after that
+                if shutil.which('laravel') is None:
+                    # Resolve composer ourselves: without a shell, Windows would not find composer.bat
+                    composer = shutil.which(LARAVEL_INSTALLER_COMMAND[0])
+                    if composer is None:
+                        Log.error("Composer not found on PATH; it is needed to install the Laravel installer")
+                        return
+                    subprocess.run([composer, *LARAVEL_INSTALLER_COMMAND[1:]], check=True,
+                                   stdout=subprocess.DEVNULL)
                 subprocess.run(f'{LARAVEL_PROJECT_CREATION_COMMAND} {self.project_root}', shell=True, check=True)
                 Log.success("Laravel project created successfully")
 
-            except subprocess.CalledProcessError:
+            except (subprocess.CalledProcessError, FileNotFoundError):
                 Log.error("Laravel project creation failed")
                 return
 
@@ -99,7 +520,8 @@ class LaravelConverter:
             self._add_routing_controller_file()
             self._add_routes_web_file()
 
-        public_only = copy_assets_in_public(self.assets_path, self.project_root / "public")
+        public_only = copy_assets_in_public(self.assets_path, self.project_root / "public",
+                                            use_hardlinks=self.use_hardlinks)
 
         copy_assets(
             self.assets_path,
@@ -116,161 +538,224 @@ class LaravelConverter:
 
     def _convert(self):
 
-        include_re = re.compile(
-            r"""@@include\(
-                      \s*["'](?P<path>[^"']+)["']
-                      (?:\s*,\s*(?P<params>\{[\s\S]*?\}|array\([\s\S]*?\)))?
-                      \s*\)""",
-            re.VERBOSE
-        )
+        files = list(_iter_views(self.project_views_path, skip_dirs={LARAVEL_AUTH_FOLDER}))
+
+        # Files are independent, so they are spread over processes to get around the GIL.
+        # The converter (route index included) is pickled once per worker, not per file
+        workers = min(os.cpu_count() or 1, len(files))
+        if workers > 1:
+            # Around four chunks per worker keeps them all busy to the end without
+            # paying a round trip per file; never more workers than files
+            chunksize = max(1, len(files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                for message, vite_inputs in executor.map(_convert_one, files, chunksize=chunksize):
+                    self.vite_inputs |= vite_inputs
+                    Log.converted(message)
+        else:
+            for path, rel_path in files:
+                Log.converted(self._convert_file(path, rel_path))
 
-        count = 0
+        Log.info(f"{len(files)} files converted in {self.project_views_path}")
 
-        for file in self.project_views_path.rglob("*.php"):
+    def _convert_file(self, path: str, rel_path: str):
+        """
+        Converts a single view in place and returns the message to log for it.
+        The file is opened once and rewritten through the same handle.
+        """
+        is_partial = 'partials' in rel_path.split(os.sep)[:-1]
 
-            rel_parts = file.relative_to(self.project_views_path).parts[:-1]
-            if any(p in {LARAVEL_AUTH_FOLDER} for p in rel_parts):
-                continue
+        # Text mode on purpose: reads normalise newlines and writes emit the platform's
+        # (CRLF on Windows), like every other generated view
+        with open(path, "r+", encoding="utf-8") as f:
+            content = f.read()
+
+            output = self._convert_view(content, is_partial)
 
-            is_partial = 'partials' in file.relative_to(self.project_views_path).parts
+            f.seek(0)
+            f.write(output)
+            f.truncate()
 
-            with open(file, "r", encoding="utf-8") as f:
-                content = f.read()
+        return f"{rel_path} (processed as {'partial' if is_partial else 'full page'})"
 
+    def _convert_view(self, content: str, is_partial: bool):
+        """
+        Returns the Blade source for a view's content.
+        """
+        if is_partial:
+            # Partials are fragments: lxml would wrap them in a synthesized <html><body>
+            # that str(soup) writes back out, so they stay on html.parser
             soup = BeautifulSoup(content, 'html.parser')
 
-            if is_partial:
-                # For partials, process scripts directly on the soup object.
-                for script_tag in soup.find_all("script"):
-                    src_attr = script_tag.get('src')
-                    if src_attr:
-                        normalized_src_attr = re.sub(r'^(?:(?:\.\/|\.\.\/)*\/)*', '', src_attr)
-                        transformed_src_attr = ""
-                        if normalized_src_attr.startswith('assets/js/') and not normalized_src_attr.startswith(
-                                ('assets/js/vendor/', 'assets/js/libs/', 'assets/js/plugins/')):
-                            transformed_src_attr = normalized_src_attr.replace("assets/", "resources/", 1)
-                        elif normalized_src_attr.startswith(
-                                ('js/', 'scripts/')) and not normalized_src_attr.startswith(
-                            ('js/vendor/', 'js/libs/', 'js/plugins/')):
-                            transformed_src_attr = "resources/" + normalized_src_attr
-                        if transformed_src_attr:
-                            vite_directive = f"@vite(['{transformed_src_attr}'])"
-                            script_tag.replace_with(NavigableString(vite_directive))
-                            self.vite_inputs.add(transformed_src_attr)
-
-                # Get the modified HTML and then process the includes
-                modified_html = str(soup)
-                final_content = self._replace_all_includes_with_blade(modified_html, include_re)
-
-                final_output = clean_relative_asset_paths(final_content)
-
-                final_output = self._rewrite_routes(final_output)
-
-                with open(file, "w", encoding="utf-8") as f:
-                    f.write(final_output)
-                Log.converted(f"{str(file.relative_to(self.project_views_path))} (processed as partial)")
-                count += 1
+            # For partials, process scripts directly on the soup object.
+            for script_tag in soup.find_all("script"):
+                src_attr = script_tag.get('src')
+                if src_attr:
+                    transformed_src_attr = _vite_src(src_attr)
+                    if transformed_src_attr:
+                        vite_directive = f"@vite(['{transformed_src_attr}'])"
+                        script_tag.replace_with(NavigableString(vite_directive))
+                        self.vite_inputs.add(transformed_src_attr)
+
+            # Get the modified HTML and then process the includes
+            modified_html = str(soup)
+            soup.decompose()
+            final_content = self._replace_all_includes_with_blade(modified_html)
+
+            final_output = clean_relative_asset_paths(final_content)
+
+            return self._rewrite_routes(final_output)
+
+        elif not _PAGE_MARKUP_RE.search(content):
+            # Plain fragment: nothing to move into the styles/scripts sections, no includes
+            # and no document wrapper, so the parse would only hand the markup back
+            content_section = self._rewrite_routes(clean_relative_asset_paths(content.strip()))
+            return "".join((
+                "@extends('layouts.vertical')",
+                "\n\n@section('styles')\n",
+                "\n@endsection\n\n@section('content')\n", content_section,
+                "\n@endsection\n\n@section('scripts')\n",
+                "\n@endsection\n",
+            ))
 
+        else:
+            # One substring check decides both include scans; the content section
+            # is cut from this page, so it cannot hold an include the page lacks
+            has_include = '@@include' in content
+
+            # Find title from the ORIGINAL content before modifications
+            # (only title includes are matched, the section pass below never sees the <head>)
+            layout_title = ""
+            for m in (_TITLE_INCLUDE_RE.finditer(content) if has_include else ()):
+                meta_data = self._extract_params_from_include(m.group(0))
+                layout_title = (meta_data.get("title") or meta_data.get("pageTitle") or "").strip()
+                if layout_title: break
+
+            escaped_layout_title = layout_title.translate(_BLADE_STR_ESCAPE)
+            extends_line = f"@extends('layouts.vertical', ['title' => '{escaped_layout_title}'])" if layout_title else "@extends('layouts.vertical')"
+
+            # Pull the link and script tags out of the page and take what remains as the content
+            if self.RAW_LXML:
+                links_html_list, scripts_output_list, base_content_for_section = self._split_page_lxml(content)
             else:
-                # Find title from the ORIGINAL content before modifications
-                layout_title = ""
-                for m in include_re.finditer(content):
-                    if Path(m.group('path')).name.lower() in {"title-meta.html", "app-meta-title.html"}:
-                        meta_data = self._extract_params_from_include(m.group(0))
-                        layout_title = (meta_data.get("title") or meta_data.get("pageTitle") or "").strip()
-                        if layout_title: break
-
-                escaped_layout_title = layout_title.replace("'", "\\'") if layout_title else ''
-                extends_line = f"@extends('layouts.vertical', ['title' => '{escaped_layout_title}'])" if layout_title else "@extends('layouts.vertical')"
-
-                # Collect and remove link tags for the 'styles' section
-                links_html_list = []
-                for link_tag in soup.find_all("link"):
-                    if link_tag.name:
-                        links_html_list.append(f"    {str(link_tag)}")
-                    link_tag.decompose()
-                links_html = "\n".join(links_html_list)
-
-                # Collect, process, and remove script tags for the 'scripts' section
-                scripts_output_list = []
-                for script_tag in soup.find_all("script"):
-                    src_attr = script_tag.get('src')
-
-                    # Only process script tags that have a 'src' attribute
-                    if src_attr:
-                        output_line = str(script_tag)
-
-                        normalized_src_attr = re.sub(r'^(?:(?:\.\/|\.\.\/)*\/)*', '', src_attr)
-                        transformed_src_attr = ""
-                        if normalized_src_attr.startswith('assets/js/') and not normalized_src_attr.startswith(
-                                ('assets/js/vendor/', 'assets/js/libs/', 'assets/js/plugins/')):
-                            transformed_src_attr = normalized_src_attr.replace("assets/", "resources/", 1)
-                        elif normalized_src_attr.startswith(
-                                ('js/', 'scripts/')) and not normalized_src_attr.startswith(
-                            ('js/vendor/', 'js/libs/', 'js/plugins/')):
-                            transformed_src_attr = "resources/" + normalized_src_attr
-
-                        if transformed_src_attr:
-                            output_line = f"@vite(['{transformed_src_attr}'])"
-                            self.vite_inputs.add(transformed_src_attr)
-
-                        scripts_output_list.append(f"    {output_line}")
-
-                    # Decompose all script tags regardless, to remove them from the main content
-                    script_tag.decompose()
-
-                scripts_html_output = "\n".join(scripts_output_list)
-
-                # Extract the main content from the now-cleaned soup
-                content_div = soup.find(attrs={"data-content": True})
-                if content_div:
-                    base_content_for_section = content_div.decode_contents()
-                elif soup.body:
-                    base_content_for_section = soup.body.decode_contents()
-                else:
-                    if soup.head: soup.head.decompose()
-                    base_content_for_section = str(soup)
-
-                # Process all @@includes within the extracted content
-                content_section = self._replace_all_includes_with_blade(base_content_for_section,
-                                                                        include_re).strip()
-
-                blade_output = f"""{extends_line}
-
-@section('styles')
-{links_html}
-@endsection
-
-@section('content')
-{content_section}
-@endsection
-
-@section('scripts')
-{scripts_html_output}
-@endsection
-            """
-                final_output = clean_relative_asset_paths(blade_output)
-
-                final_output = self._rewrite_routes(final_output)
-
-                with open(file, "w", encoding="utf-8") as f:
-                    f.write(final_output.strip() + "\n")
-
-                Log.converted(f"{str(file.relative_to(self.project_views_path))} (processed as full page)")
-                count += 1
+                links_html_list, scripts_output_list, base_content_for_section = self._split_page_soup(content)
+
+            links_html = "\n".join(links_html_list)
+            scripts_html_output = "\n".join(scripts_output_list)
+
+            # Process all @@includes within the extracted content
+            if has_include:
+                base_content_for_section = self._replace_all_includes_with_blade(base_content_for_section)
+            content_section = base_content_for_section.strip()
+
+            # Only the content can hold page links; asset paths live in every section
+            content_section = self._rewrite_routes(clean_relative_asset_paths(content_section))
+            links_html = clean_relative_asset_paths(links_html)
+            scripts_html_output = clean_relative_asset_paths(scripts_html_output)
+
+            return "".join((
+                extends_line,
+                "\n\n@section('styles')\n", links_html,
+                "\n@endsection\n\n@section('content')\n", content_section,
+                "\n@endsection\n\n@section('scripts')\n", scripts_html_output,
+                "\n@endsection\n",
+            ))
+
+    def _script_output_line(self, src_attr, serialize):
+        """
+        Returns the 'scripts' section line for a script tag with a src; serialize is only
+        called when the tag stays as-is rather than becoming an @vite directive.
+        """
+        transformed_src_attr = _vite_src(src_attr)
+        if transformed_src_attr:
+            self.vite_inputs.add(transformed_src_attr)
+            return f"    @vite(['{transformed_src_attr}'])"
+        return "    " + serialize()
+
+    def _split_page_lxml(self, content: str):
+        """
+        Splits a full page into its serialized link tags, script section lines and
+        content HTML, working on the raw lxml.html tree.
+        """
+        try:
+            root = lxml.html.document_fromstring(content)
+        except etree.ParserError:
+            # Empty or comment-only document
+            return [], [], _strip_page_source(content)
+        except ValueError:
+            # lxml refuses a str that starts with an <?xml ... encoding="..."?> declaration
+            return self._split_page_soup(content)
+
+        links_html_list = []
+        scripts_output_list = []
+        for el in list(root.iter("link", "script")):
+            if el.tag == "link":
+                links_html_list.append("    " + _lxml_tag_html(el))
+            else:
+                # Only script tags that have a 'src' attribute go to the section
+                src_attr = el.get('src')
+                if src_attr:
+                    scripts_output_list.append(self._script_output_line(src_attr, lambda: _lxml_tag_html(el)))
+            # Every link/script leaves the content; drop_tree keeps the text that follows it
+            el.drop_tree()
+
+        content_div = root.find('.//*[@data-content]')
+        if content_div is not None:
+            return links_html_list, scripts_output_list, _lxml_inner_html(content_div)
+
+        body = root.find('body')
+        if body is not None:
+            return links_html_list, scripts_output_list, _lxml_inner_html(body)
+
+        # lxml has no <body> for head-only documents
+        return links_html_list, scripts_output_list, _strip_page_source(content)
+
+    def _split_page_soup(self, content: str):
+        """
+        BeautifulSoup counterpart of _split_page_lxml, used when RAW_LXML is off or lxml is missing.
+        """
+        # Keep only the nodes used below
+        soup = BeautifulSoup(content, _PAGE_PARSER, parse_only=_PAGE_STRAINER)
+
+        links_html_list = []
+        scripts_output_list = []
+        for tag in soup.find_all(["link", "script"]):
+            if tag.name == "link":
+                links_html_list.append("    " + tag.decode())
+            else:
+                src_attr = tag.get('src')
+                if src_attr:
+                    scripts_output_list.append(self._script_output_line(src_attr, tag.decode))
+            # Already serialized, so just detach it instead of tearing the node down
+            tag.extract()
+
+        content_div = soup.find(attrs={"data-content": True})
+        if content_div:
+            base_content_for_section = content_div.decode_contents()
+        elif soup.body:
+            base_content_for_section = soup.body.decode_contents()
+        else:
+            # No <body> for empty, comment-only or head-only documents (html.parser never adds one);
+            # strip the source text instead of building a second, unstrained tree
+            base_content_for_section = _strip_page_source(content)
 
-        Log.info(f"{count} files converted in {self.project_views_path}")
+        # BS4 trees are reference cycles; free this one now instead of waiting for the collector
+        soup.decompose()
 
-    def _replace_all_includes_with_blade(self, content: str, include_re: re.Pattern):
+        return links_html_list, scripts_output_list, base_content_for_section
+
+    def _replace_all_includes_with_blade(self, content: str):
         """
         A generic replacer that converts any @@include into a Blade @include.
         """
+        if '@@include' not in content:
+            return content
 
         def _replacer(match: re.Match):
             inc_path_str = match.group('path')
 
             # Exclude title includes from this generic replacement, they are handled separately
-            if Path(inc_path_str).name.lower() in {"title-meta.html", "app-meta-title.html"}:
+            if _is_title_include(inc_path_str):
                 return ''  # Remove title includes, as they are used for the @extends line
 
             params = {}
@@ -278,13 +763,7 @@ class LaravelConverter:
             if match.group('params'):
                 params = self._extract_params_from_include(match.group(0))
 
-            blade_path = (
-                Path(inc_path_str)
-                .with_suffix('')
-                .as_posix()
-                .lstrip('./')
-                .replace('/', '.')
-            )
+            blade_path = _blade_path_for(inc_path_str)
 
             if params:
                 formatted_params = self._format_blade_include_params(params)
@@ -292,7 +771,7 @@ class LaravelConverter:
             else:
                 return f"@include('{blade_path}')"
 
-        return include_re.sub(_replacer, content)
+        return _INCLUDE_RE.sub(_replacer, content)
 
     def _extract_params_from_include(self, include_string: str):
         """
@@ -300,45 +779,20 @@ class LaravelConverter:
         It handles malformed JSON with comments, newlines, single quotes,
         unquoted keys, and trailing commas.
         """
-        # First, try to find a JSON-like object (between {})
-        param_match = re.search(r'(\{[\s\S]*\})', include_string)
-        if param_match:
-            s = param_match.group(1)
+        # First, try to find a JSON-like object (first '{' to last '}')
+        start = include_string.find('{')
+        end = include_string.rfind('}')
+        if start != -1 and end > start:
+            s = include_string[start:end + 1]
 
             # Decode HTML entities (&amp; -> &)
             s = html.unescape(s)
 
-            # Remove JS-style comments (// and /* */)
-            s = re.sub(r'//.*?$', '', s, flags=re.MULTILINE)
-            s = re.sub(r'/\*[\s\S]*?\*/', '', s)
-
-            # Normalize newlines and excess whitespace inside string values.
-            # This is crucial for multi-line strings.
-            def _normalize_str_content(match):
-                # Get the content inside the quotes (group 1)
-                content = match.group(1)
-                # Replace newlines, tabs, etc., with a space
-                content = re.sub(r'[\n\r\t]', ' ', content)
-                # Collapse multiple spaces into one
-                content = re.sub(r'\s{2,}', ' ', content).strip()
-                # Return the cleaned string within double quotes
-                return f'"{content}"'
-
-            # This regex finds content within single or double quotes, handling escaped quotes
-            s = re.sub(r'"((?:\\.|[^"\\])*)"', _normalize_str_content, s)
-            s = re.sub(r"'((?:\\.|[^'\\])*)'", _normalize_str_content, s)
-
-            # Add double quotes around any unquoted keys (e.g., { key: "value" })
-            # Handles keys at the start of the object or after a comma.
-            s = re.sub(r'([\{\s,])\s*([a-zA-Z_][\w-]*)\s*:', r'\1"\2":', s)
-
-            # Remove trailing commas (e.g., "value", })
-            s = re.sub(r',\s*([\}\]])', r'\1', s)
+            # Strip comments, normalize quotes/whitespace, quote keys and drop trailing commas
+            s = _sanitize_json_ish(s)
 
             # Try to parse the now-clean JSON string
             try:
-                # Convert any remaining single-quoted values to double-quoted
-                s = re.sub(r":\s*'([^']*)'", r': "\1"', s)
                 return json.loads(s)
             except json.JSONDecodeError as e:
                 Log.warning(f"Could not parse JSON for: {include_string}. Error: {e}\nCleaned string was: {s}")
@@ -351,29 +805,20 @@ class LaravelConverter:
         """
         Handles extraction from PHP array syntax. (Your original PHP logic)
         """
-        m_arr = re.search(r'array\s*\(([\s\S]*)\)', include_string)
+        m_arr = _PHP_ARRAY_RE.search(include_string) if 'array' in include_string else None
         if not m_arr:
             return {}
 
         body = m_arr.group(1)
         params_dict = {}
-        param_pattern = re.compile(r"""
-            (?:['"](?P<key>[^'"]+)['"]\s*=>\s*)?
-            (?:
-                ['"](?P<sval>(?:\\.|[^'"])*)['"] |
-                (?P<nval>-?\d+(?:\.\d+)?) |
-                (?P<bool>true|false)
-            )
-            \s*(?:,\s*|$)
-        """, re.VERBOSE | re.DOTALL)
-
-        for match in param_pattern.finditer(body):
+        for match in _PARAM_PATTERN.finditer(body):
             key = match.group('key')
             if not key:
                 continue
             if match.group('sval') is not None:
-                value = match.group('sval').replace('\\"', '"').replace("\\'", "'")
-                value = value.encode('latin1').decode('unicode_escape')
+                value = match.group('sval')
+                if '\\' in value:
+                    value = _PHP_ESCAPE_RE.sub(lambda m: _PHP_ESCAPES[m.group(1)], value)
             elif match.group('nval') is not None:
                 value = float(match.group('nval')) if '.' in match.group('nval') else int(match.group('nval'))
             elif match.group('bool') is not None:
@@ -387,18 +832,12 @@ class LaravelConverter:
         """
         Formats a Python dictionary into a Blade-compatible array string for @include parameters.
         """
-        params_list = []
-        for key, value in data_dict.items():
-            if isinstance(value, str):
-                escaped_value = value.replace('\\', '\\\\').replace("'", "\\'")
-                params_list.append(f"'{key}' => '{escaped_value}'")
-            elif isinstance(value, bool):
-                params_list.append(f"'{key}' => {'true' if value else 'false'}")
-            elif isinstance(value, (int, float)):
-                params_list.append(f"'{key}' => {value}")
-            else:
-                params_list.append(f"'{key}' => '{str(value).replace('\'', '\\\'')}'")
-        return ", ".join(params_list)
+        # The same include params recur across pages, so the formatted string is cached
+        try:
+            return _format_params_cached(tuple((key, type(value), value) for key, value in data_dict.items()))
+        except TypeError:
+            # Nested lists/objects are not hashable
+            return _format_params(data_dict.items())
 
     def _format_page_title_blade_include(self, data_dict):
         """
@@ -409,41 +848,8 @@ class LaravelConverter:
 
     def _add_routing_controller_file(self):
         self.project_controllers_path.mkdir(parents=True, exist_ok=True)
-
-        controller_content = r"""<?php
-
-namespace App\Http\Controllers;
-
-use Illuminate\Support\Facades\Auth;
-use Illuminate\Http\Request;
-
-class RoutingController extends Controller
-{
-
-    public function index(Request $request)
-    {
-        return view('index');
-    }
-
-    public function root(Request $request, $first)
-    {
-        return view($first);
-    }
-
-    public function secondLevel(Request $request, $first, $second)
-    {
-        return view($first . '.' . $second);
-    }
-
-    public function thirdLevel(Request $request, $first, $second, $third)
-    {
-        return view($first . '.' . $second . '.' . $third);
-    }
-}
-    """
         try:
-            with open(self.project_route_controller_path, "w", encoding="utf-8") as f:
-                f.write(controller_content.strip() + "\n")
+            self.project_route_controller_path.write_text(_ROUTING_CONTROLLER_SOURCE, encoding="utf-8")
             Log.created(
                 f"controller file {self.project_route_controller_path.relative_to(self.project_root)}")
         except Exception as e:
@@ -452,22 +858,8 @@ class RoutingController extends Controller
     def _add_routes_web_file(self):
 
         self.project_routes_path.parent.mkdir(parents=True, exist_ok=True)
-
-        routes_content = r"""<?php
-
-use Illuminate\Support\Facades\Route;
-use App\Http\Controllers\RoutingController;
-
-Route::group(['prefix' => '/'], function () {
-    Route::get('', [RoutingController::class, 'index'])->name('root');
-    Route::get('{first}/{second}/{third}', [RoutingController::class, 'thirdLevel'])->name('third');
-    Route::get('{first}/{second}', [RoutingController::class, 'secondLevel'])->name('second');
-    Route::get('{any}', [RoutingController::class, 'root'])->name('any');
-});
-    """
         try:
-            with open(self.project_routes_path, "w", encoding="utf-8") as f:
-                f.write(routes_content.strip() + "\n")
+            self.project_routes_path.write_text(_ROUTES_WEB_SOURCE, encoding="utf-8")
             Log.updated(f"routing file {self.project_routes_path.relative_to(self.project_root)}")
         except Exception as e:
             Log.error(f"Error writing to {self.project_routes_path}: {e}")
@@ -481,20 +873,26 @@ Route::group(['prefix' => '/'], function () {
 
     def _replace_partial_variables(self):
         count = 0
-        pattern = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
 
-        for file in self.project_partials_path.rglob(f"*{LARAVEL_EXTENSION}"):
-            if not file.is_file():
+        for file, _ in _iter_views(self.project_partials_path):
+            if not file.endswith(LARAVEL_EXTENSION):
                 continue
             try:
-                content = file.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
+                # Cheap byte scan first, most partials have no variables at all
+                with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'@@') == -1:
+                        continue
+                    # Decode straight from the mapping instead of reading the file again
+                    content = mm[:].decode("utf-8")
+            except (UnicodeDecodeError, OSError, ValueError):
+                # ValueError: empty files cannot be mapped
                 continue
 
-            new_content = pattern.sub(r'{{ $\1 }}', content)
-            if new_content != content:
-                file.write_text(new_content, encoding="utf-8")
-                Log.updated(str(file))
+            new_content, n = _PARTIAL_VAR_RE.subn(r'{{ $\1 }}', content)
+            if n:
+                with open(file, "wb") as f:
+                    f.write(new_content.encode("utf-8"))
+                Log.updated(file)
                 count += 1
 
         if count:
@@ -510,8 +908,8 @@ Route::group(['prefix' => '/'], function () {
           ai-ton_ai.html -> href key 'ai-ton-ai.html' -> route('second',['ai','ton-ai'])
         """
         index = {}
-        for f in self.source_path.rglob("*.html"):
-            stem = f.stem  # e.g. "ai-ton_ai", "tables-datatables-export_data"
+        for name in _iter_html(self.source_path):
+            stem = name[:-5]  # e.g. "ai-ton_ai", "tables-datatables-export_data"
             levels_raw = stem.split('-')  # '-' defines levels
             levels = [part.replace('_', '-') for part in levels_raw]  # '_' -> '-' inside a level
 
@@ -550,7 +948,9 @@ Route::group(['prefix' => '/'], function () {
         return f"{{{{ route('{route}', {params}) }}}}"
 
     def _rewrite_routes(self, html: str):
-        pattern = re.compile(r'''href\s*=\s*(['"])(?!http|#|javascript:)([^'"]+?\.html)\1''', re.IGNORECASE)
+        # Pages without any .html link need no regex walk at all
+        if '.html' not in html:
+            return html
 
         def repl(m):
             quote_in = m.group(1)
@@ -570,7 +970,8 @@ Route::group(['prefix' => '/'], function () {
             # always emit double quotes around href
             return f'href="{route}"'
 
-        return pattern.sub(repl, html)
+        new_html, n = _HREF_RE.subn(repl, html)
+        return html if n == 0 else new_html
 
     def _update_vite_config(self):
         """
@@ -586,12 +987,8 @@ Route::group(['prefix' => '/'], function () {
         if self.project_vite_path.exists():
             content = self.project_vite_path.read_text(encoding="utf-8")
 
-            # Regex to find an existing `input: [...]` array.
-            # re.DOTALL allows '.' to match newlines, handling multi-line arrays.
-            input_array_regex = re.compile(r"input\s*:\s*\[[\s\S]*?\]", re.DOTALL)
-
-            # Try to substitute the old input array with the new one.
-            new_content, num_replacements = input_array_regex.subn(new_input_block, content, count=1)
+            # Try to substitute an existing `input: [...]` array with the new one.
+            new_content, num_replacements = _VITE_INPUT_RE.subn(new_input_block, content, count=1)
 
             if num_replacements > 0:
                 self.project_vite_path.write_text(new_content, encoding="utf-8")
@@ -599,10 +996,9 @@ Route::group(['prefix' => '/'], function () {
                 return
 
             # If no 'input' array was found, try to inject one into the laravel plugin config.
-            laravel_plugin_regex = re.compile(r"(laravel\s*\(\s*\{)", re.DOTALL)
             # Add the input block right after `laravel({`
             injection_block = f"\\1\n        {new_input_block},"
-            new_content, num_injections = laravel_plugin_regex.subn(injection_block, content, count=1)
+            new_content, num_injections = _VITE_LARAVEL_PLUGIN_RE.subn(injection_block, content, count=1)
 
             if num_injections > 0:
                 self.project_vite_path.write_text(new_content, encoding="utf-8")
@@ -3,15 +3,16 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup
 
 from transpilex.config.base import MVC_DESTINATION_FOLDER, MVC_ASSETS_FOLDER, MVC_PROJECT_CREATION_COMMAND, \
     SLN_FILE_CREATION_COMMAND, MVC_GULP_ASSETS_PATH, MVC_EXTENSION
 from transpilex.helpers import copy_assets
 from transpilex.helpers.plugins_file import plugins_file
 from transpilex.helpers.casing import to_pascal_case
-from transpilex.helpers.clean_relative_asset_paths import clean_relative_asset_paths
+from transpilex.helpers.clean_relative_asset_paths import clean_asset_path
 from transpilex.helpers.empty_folder_contents import empty_folder_contents
 from transpilex.helpers.gulpfile import add_gulpfile
 from transpilex.helpers.logs import Log
@@ -19,6 +20,142 @@ from transpilex.helpers.restructure_files import apply_casing
 from transpilex.helpers.package_json import update_package_json
 from transpilex.helpers.validations import folder_exists
 
+_INCLUDE_RE = re.compile(r'@@include\(\s*["\'](.*?)["\']\s*(?:,\s*({.*?}))?\s*\)', re.DOTALL)
+# Finds all "key": "value" pairs of an include's params, ignoring formatting issues
+_KV_RE = re.compile(r'"([^"]+)"\s*:\s*"([^"]*)"')
+_VAR_RE = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
+_TOKEN_SPLIT_RE = re.compile(r'[-_]+')
+# A src/href attribute and its value: double-quoted, single-quoted or bare
+_URL_ATTR_RE = re.compile(r'\b(src|href)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))', re.IGNORECASE)
+# One attribute of a start tag (name in group 1), walked so that quoted values are skipped whole
+_TAG_ATTR_PATTERN = r'''\s+([^\s=>"']+)(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>"'][^\s>]*))?'''
+_TAG_ATTR_RE = re.compile(_TAG_ATTR_PATTERN)
+# An <a> start tag, its attributes in group 1
+_ANCHOR_TAG_RE = re.compile(rf'<a(?=[\s/>])((?:{_TAG_ATTR_PATTERN})*)\s*/?>', re.IGNORECASE)
+
+# Tags a page moves into its styles/scripts sections. Comments are matched first so that
+# commented-out tags are left alone
+_MOVABLE_TAG_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<script\b[^>]*>(?P<script>.*?)</script\s*>'
+    r'|(?P<link><link\b[^>]*>)',
+    re.DOTALL | re.IGNORECASE)
+_STYLESHEET_REL_RE = re.compile(r'\brel\s*=\s*["\']?[^"\'>]*\bstylesheet\b', re.IGNORECASE)
+# The inline footer-year script stays in the content
+_SCRIPT_TO_EXCLUDE = "document.write(new Date().getFullYear())"
+
+# An opening tag with a data-content attribute. The attributes before it are walked one by
+# one so that the name is never matched inside a quoted value or as part of another name
+_DATA_CONTENT_RE = re.compile(
+    r'<([a-z][\w-]*)'
+    r'(?:\s+[^\s=>/"\']+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>"\'][^\s>]*))?)*?'
+    r'\s+data-content(?=[\s=/>])[^>]*>',
+    re.IGNORECASE)
+_BODY_RE = re.compile(r'<body\b[^>]*>(.*)</body\s*>', re.DOTALL | re.IGNORECASE)
+# What a page without a whole <body> drops from its content: the head, the doctype and the
+# document tags
+_NO_BODY_STRIP_RE = re.compile(
+    r'<head\b[^>]*>.*?</head\s*>|<!doctype\b[^>]*>|</?(?:html|head|body)\b[^>]*>',
+    re.DOTALL | re.IGNORECASE)
+
+
+def _inner_html(content: str, open_tag) -> str:
+    """
+    Returns what sits between the tag matched by open_tag and its closing tag, counting
+    nested tags of the same name; an unclosed tag runs to the end of the content.
+    Tags inside comments are not counted.
+    """
+    same_name_tag = re.compile(rf'<!--.*?-->|<(/?){re.escape(open_tag.group(1))}\b[^>]*>',
+                               re.DOTALL | re.IGNORECASE)
+    depth = 1
+    for m in same_name_tag.finditer(content, open_tag.end()):
+        if m.group(1) is None:
+            # A comment, matched only so that the tags in it are skipped
+            continue
+        if m.group(1):
+            depth -= 1
+            if depth == 0:
+                return content[open_tag.end():m.start()]
+        elif not m.group(0).endswith('/>'):
+            depth += 1
+    return content[open_tag.end():]
+
+
+def _anchor_href_starts(content: str) -> set[int]:
+    """
+    Positions of the href attribute names of every <a> start tag. Attributes are walked
+    one by one, so a '>' or 'href=' inside a quoted value and names such as data-href or
+    xlink:href are never taken for the link.
+    """
+    starts = set()
+    for tag in _ANCHOR_TAG_RE.finditer(content):
+        for attr in _TAG_ATTR_RE.finditer(content, tag.start(1), tag.end(1)):
+            if attr.group(1).lower() == 'href':
+                starts.add(attr.start(1))
+    return starts
+
+
+@lru_cache(maxsize=None)
+def _tokenize(stem: str) -> tuple[str, ...]:
+    # split on both '-' and '_', lowercase for stable compare
+    return tuple(t for t in _TOKEN_SPLIT_RE.split(stem.lower()) if t)
+
+
+def _iter_html(root):
+    """
+    Yields every *.html file under root as a Path, in rglob order (a folder's own files
+    before its subfolders), reading entry types from the directory listing instead of
+    stat-ing every path.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    subdirs = []
+    with it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.name.endswith('.html') and e.is_file():
+                yield Path(e.path)
+    for subdir in subdirs:
+        yield from _iter_html(subdir)
+
+
+# Partials allowed to set the page's ViewBag properties
+_PAGE_TITLE_PARTIALS = ["page-title.html", "app-pagetitle.html", "title-meta.html", "app-meta-title.html"]
+
+_ACTION_TEMPLATE = """        public IActionResult {action}()
+        {{
+            return View();
+        }}
+
+"""
+
+_CONTROLLER_TEMPLATE = """using Microsoft.AspNetCore.Mvc;
+
+namespace {project_name}.Controllers
+{{
+    public class {controller_name}Controller : Controller
+    {{
+{actions}    }}
+}}"""
+
+_worker_converter = None
+
+
+def _init_worker(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_one(job):
+    """
+    Converts one (source file, casing) page in a worker process and returns the
+    target file with its content, for the parent to write.
+    """
+    return _worker_converter._convert_page(*job)
+
 
 class MVCConverter:
     def __init__(self, project_name: str, source_path: str, assets_path: str, include_gulp: bool = True):
@@ -34,6 +171,9 @@ class MVCConverter:
         self.project_partials_path = self.project_views_path / "Shared" / "Partials"
         self.project_controllers_path = Path(self.project_root / "Controllers")
 
+        # Include path -> Razor partial call; the same partials are included on every page
+        self._partial_replacement_cache = {}
+
         self.create_project()
 
     def create_project(self):
@@ -50,26 +190,20 @@ class MVCConverter:
 
         self.project_root.parent.mkdir(parents=True, exist_ok=True)
 
-        try:
-            subprocess.run(
-                f'{MVC_PROJECT_CREATION_COMMAND} {self.project_name}', cwd=self.project_root.parent,
-                shell=True, check=True)
-
-            Log.success("MVC project created successfully")
-
-            subprocess.run(
-                f'{SLN_FILE_CREATION_COMMAND} {self.project_name}', cwd=self.project_root.parent, shell=True,
-                check=True)
-
-            sln_file = f"{self.project_name}.sln"
+        sln_file = f"{self.project_name}.sln"
+        csproj_file = Path(self.project_name) / f"{self.project_name}.csproj"
 
+        try:
+            # One shell for all three dotnet steps ('&&' chains in both sh and cmd)
             subprocess.run(
-                f'dotnet sln {sln_file} add {Path(self.project_name) / self.project_name}.csproj',
+                f'{MVC_PROJECT_CREATION_COMMAND} {self.project_name}'
+                f' && {SLN_FILE_CREATION_COMMAND} {self.project_name}'
+                f' && dotnet sln {sln_file} add {csproj_file}',
                 cwd=self.project_root.parent, shell=True, check=True)
 
+            Log.success("MVC project created successfully")
             Log.info(".sln file created successfully")
 
-
         except subprocess.CalledProcessError:
             Log.error("MVC project creation failed")
             return
@@ -94,92 +228,114 @@ class MVCConverter:
         Log.project_end(self.project_name, str(self.project_root))
 
     def _convert(self, skip_dirs=None, casing="pascal"):
-        count = 0
         if skip_dirs is None:
             skip_dirs = ['partials']
 
-        # Define which partials are allowed to set the page's ViewBag properties
-        page_title_partials = ["page-title.html", "app-pagetitle.html", "title-meta.html", "app-meta-title.html"]
-
-        for file in self.source_path.rglob("*.html"):
+        jobs = []
+        for file in _iter_html(self.source_path):
             relative_file_path_str = str(file.relative_to(self.source_path)).replace("\\", "/")
-            if not file.is_file() or any(skip in relative_file_path_str for skip in skip_dirs):
+            if any(skip in relative_file_path_str for skip in skip_dirs):
                 continue
+            jobs.append((file, casing))
 
-            with open(file, "r", encoding="utf-8") as f:
-                raw_html = f.read()
-
-            # Process all includes and extract page-title data at the same time
-            processed_html, viewbag_data = self._process_includes(raw_html, page_title_partials)
-
-            if not viewbag_data:
-                Log.warning(
-                    f"No ViewBag data extracted for page: {file.name}")
-
-            soup = BeautifulSoup(processed_html, "html.parser")
+        # Built before any worker starts, so each one receives it with the converter
+        self._build_file_index()
 
-            # ... (the rest of your logic for finding scripts, links, and content block) ...
-            all_script_tags = soup.find_all('script')
-            link_tags = soup.find_all('link', rel='stylesheet')
+        # Pages are independent, so they are converted in separate processes to get around
+        # the GIL. Writes and logs stay here, in source order
+        workers = min(os.cpu_count() or 1, len(jobs))
+        if workers > 1:
+            # Around four chunks per worker keeps them all busy to the end without
+            # paying a round trip per page
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                for target_file, cshtml_content in executor.map(_convert_one, jobs, chunksize=chunksize):
+                    self._write_page(target_file, cshtml_content)
+        else:
+            for job in jobs:
+                self._write_page(*self._convert_page(*job))
+
+        Log.info(f"{len(jobs)} files converted in {self.project_views_path}")
+
+    def _write_page(self, target_file: Path, cshtml_content: str):
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.write_text(cshtml_content, encoding="utf-8")
+        Log.converted(str(target_file))
+
+    def _convert_page(self, file: Path, casing: str):
+        """
+        Converts a single source page and returns its target .cshtml path and content.
+        Nothing is written here, so it can run in a worker process.
+        """
+        raw_html = file.read_text(encoding="utf-8")
+
+        # Process all includes and extract page-title data at the same time
+        processed_html, viewbag_data = self._process_includes(raw_html, _PAGE_TITLE_PARTIALS)
+
+        if not viewbag_data:
+            Log.warning(
+                f"No ViewBag data extracted for page: {file.name}")
+
+        scripts_to_move = []
+        link_tags = []
+
+        def move_tag(match):
+            if match.group("link") is not None:
+                if not _STYLESHEET_REL_RE.search(match.group(0)):
+                    return match.group(0)
+                link_tags.append(match.group(0))
+            elif match.group("script") is not None:
+                # Leave the excluded script in the main content
+                if match.group("script").strip() == _SCRIPT_TO_EXCLUDE:
+                    return match.group(0)
+                # ALL other scripts (inline or external) are moved
+                scripts_to_move.append(match.group(0))
+            else:
+                return match.group(0)  # a comment
+            return ""
 
-            scripts_to_move = []
-            # Define the exact text of the script you want to exclude
-            script_to_exclude = "document.write(new Date().getFullYear())"
+        # One pass collects the moved tags and cuts them out of the page
+        page_html = _MOVABLE_TAG_RE.sub(move_tag, processed_html)
 
-            for tag in all_script_tags:
-                # Check if the tag's text content matches the one to exclude
-                if tag.get_text(strip=True) == script_to_exclude:
-                    # If it matches, do nothing. Leave it in the main content.
-                    pass
-                else:
-                    # For ALL other scripts (inline or external), add them to the move list.
-                    scripts_to_move.append(tag)
+        scripts_content = "\n    ".join(scripts_to_move)
+        styles_content = "\n    ".join(link_tags)
 
-            scripts_content = "\n    ".join([str(tag) for tag in scripts_to_move])
-            styles_content = "\n    ".join([str(tag) for tag in link_tags])
+        content_block = _DATA_CONTENT_RE.search(page_html)
+        if content_block:
+            main_content = _inner_html(page_html, content_block).strip()
+        else:
+            body = _BODY_RE.search(page_html)
+            main_content = (body.group(1) if body else _NO_BODY_STRIP_RE.sub("", page_html)).strip()
 
-            # Decompose only the tags that have been moved.
-            tags_to_decompose = scripts_to_move + link_tags
-            for tag in tags_to_decompose:
-                tag.decompose()
+        # ... (the rest of your logic for determining file names and paths) ...
+        base_name = file.stem
+        if '-' in base_name:
+            name_parts = [part.replace("_", "-") for part in base_name.split('-')]
+            final_file_name = name_parts[-1]
+            file_based_folders = name_parts[:-1]
+        else:
+            file_based_folders = [base_name.replace("_", "-")]
+            final_file_name = "index"
 
-            content_block = soup.find(attrs={"data-content": True})
-            if content_block:
-                main_content = content_block.decode_contents().strip()
-            elif soup.body:
-                main_content = soup.body.decode_contents().strip()
-            else:
-                main_content = soup.decode_contents().strip()
-
-            # ... (the rest of your logic for determining file names and paths) ...
-            base_name = file.stem
-            if '-' in base_name:
-                name_parts = [part.replace("_", "-") for part in base_name.split('-')]
-                final_file_name = name_parts[-1]
-                file_based_folders = name_parts[:-1]
-            else:
-                file_based_folders = [base_name.replace("_", "-")]
-                final_file_name = "index"
+        relative_path = file.relative_to(self.source_path)
+        relative_folder_parts = list(relative_path.parent.parts)
+        combined_folder_parts = relative_folder_parts + file_based_folders
+        processed_folder_parts = [apply_casing(p, casing) for p in combined_folder_parts]
+        processed_file_name = apply_casing(final_file_name, casing)
 
-            relative_path = file.relative_to(self.source_path)
-            relative_folder_parts = list(relative_path.parent.parts)
-            combined_folder_parts = relative_folder_parts + file_based_folders
-            processed_folder_parts = [apply_casing(p, casing) for p in combined_folder_parts]
-            processed_file_name = apply_casing(final_file_name, casing)
+        target_dir = self.project_views_path / Path(*processed_folder_parts)
+        target_file = target_dir / f"{processed_file_name}{MVC_EXTENSION}"
+        route_path = "/" + base_name.lower().replace("_", "-")
 
-            target_dir = self.project_views_path / Path(*processed_folder_parts)
-            target_dir.mkdir(parents=True, exist_ok=True)
-            target_file = target_dir / f"{processed_file_name}{MVC_EXTENSION}"
-            route_path = "/" + base_name.lower().replace("_", "-")
+        # Generate ViewBag code from the extracted data
+        if not viewbag_data.get("Title"):
+            viewbag_data["Title"] = processed_file_name  # Fallback title
 
-            # Generate ViewBag code from the extracted data
-            if not viewbag_data.get("Title"):
-                viewbag_data["Title"] = processed_file_name  # Fallback title
+        viewbag_code = self._generate_viewbag_code(viewbag_data)
 
-            viewbag_code = self._generate_viewbag_code(viewbag_data)
-
-            # ... (your logic for generating the final cshtml_content string) ...
-            cshtml_content = f"""{viewbag_code}
+        # ... (your logic for generating the final cshtml_content string) ...
+        cshtml_content = f"""{viewbag_code}
 
 @section styles
 {{
@@ -193,16 +349,9 @@ class MVCConverter:
     {scripts_content}
 }}"""
 
-            cshtml_content = clean_relative_asset_paths(cshtml_content)
-            cshtml_content = self._replace_html_links(cshtml_content, current_source_dir=file.parent)
-
-            with open(target_file, "w", encoding="utf-8") as f:
-                f.write(cshtml_content.strip() + "\n")
-
-            Log.converted(str(target_file))
-            count += 1
+        cshtml_content = self._rewrite_urls(cshtml_content, current_source_dir=file.parent)
 
-        Log.info(f"{count} files converted in {self.project_views_path}")
+        return target_file, cshtml_content.strip() + "\n"
 
     def _process_includes(self, content: str, page_title_partials: list[str]):
         """
@@ -211,8 +360,6 @@ class MVCConverter:
         """
         viewbag_data = {}
 
-        pattern = re.compile(r'@@include\(\s*["\'](.*?)["\']\s*(?:,\s*({.*?}))?\s*\)', re.DOTALL)
-
         def replacer(match):
             partial_path_str = match.group(1)
             json_str = match.group(2)
@@ -227,9 +374,21 @@ class MVCConverter:
                     # Convert all single quotes to double quotes to handle both styles
                     normalized_json = json_str.replace("'", '"')
 
-                    # This regex finds all "key": "value" pairs, ignoring formatting issues.
-                    kv_pattern = re.compile(r'"([^"]+)"\s*:\s*"([^"]*)"')
-                    matches = kv_pattern.findall(normalized_json)
+                    # Well-formed params (the common case) go through the C JSON parser; anything
+                    # else, or params with non-string values, falls back to the regex pick.
+                    # ViewBag values are emitted as written, so params with escapes (which
+                    # json.loads would decode) also take the regex pick
+                    data = None
+                    if '\\' not in normalized_json:
+                        try:
+                            data = json.loads(normalized_json)
+                        except json.JSONDecodeError:
+                            pass
+
+                    if isinstance(data, dict) and all(isinstance(v, str) for v in data.values()):
+                        matches = data.items()
+                    else:
+                        matches = _KV_RE.findall(normalized_json)
 
                     if not matches:
                         Log.warning(f"Could not extract any key-value pairs from {partial_filename}")
@@ -243,14 +402,19 @@ class MVCConverter:
                     Log.error(f"An unexpected error occurred while parsing JSON for {partial_filename}. Reason: {e}")
                     Log.info(f"Problematic string: {json_str}")
 
-            # Convert the partial's filename to the Razor convention (_PascalCase.cshtml)
-            pascal_stem = to_pascal_case(partial_stem)
-            razor_partial_name = f"_{pascal_stem}{MVC_EXTENSION}"
+            razor = self._partial_replacement_cache.get(partial_path_str)
+            if razor is None:
+                # Convert the partial's filename to the Razor convention (_PascalCase.cshtml)
+                pascal_stem = to_pascal_case(partial_stem)
+                razor_partial_name = f"_{pascal_stem}{MVC_EXTENSION}"
+
+                # The Razor syntax for a partial view
+                razor = f'@await Html.PartialAsync("~/Views/Shared/Partials/{razor_partial_name}")'
+                self._partial_replacement_cache[partial_path_str] = razor
 
-            # Return the Razor syntax for a partial view
-            return f'@await Html.PartialAsync("~/Views/Shared/Partials/{razor_partial_name}")'
+            return razor
 
-        processed_content = pattern.sub(replacer, content)
+        processed_content = _INCLUDE_RE.sub(replacer, content)
         return processed_content, viewbag_data
 
     def _generate_viewbag_code(self, data: dict):
@@ -266,22 +430,11 @@ class MVCConverter:
 
     def _create_controller_file(self, path, controller_name, actions):
         """Creates a controller file with basic action methods."""
-        using_statements = "using Microsoft.AspNetCore.Mvc;"
-
-        controller_class = f"""
-namespace {self.project_name}.Controllers
-{{
-    public class {controller_name}Controller : Controller
-    {{
-{"".join([f"""        public IActionResult {action}()
-        {{
-            return View();
-        }}\n\n""" for action in actions])}    }}
-}}
-    """.strip()
-
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(using_statements + "\n\n" + controller_class)
+        body = "".join(_ACTION_TEMPLATE.format(action=action) for action in actions)
+        Path(path).write_text(
+            _CONTROLLER_TEMPLATE.format(project_name=self.project_name, controller_name=controller_name,
+                                        actions=body),
+            encoding="utf-8")
 
     def _create_controllers(self, ignore_list=None):
         """
@@ -298,21 +451,18 @@ namespace {self.project_name}.Controllers
 
         os.makedirs(self.project_controllers_path, exist_ok=True)
 
-        for folder_name in os.listdir(self.project_views_path):
-            if folder_name in ignore_list:
-                continue
+        # Entry types come with the directory listing, so no extra stat per folder
+        with os.scandir(self.project_views_path) as it:
+            folders = [e for e in it if e.name not in ignore_list and e.is_dir()]
 
-            folder_path = os.path.join(self.project_views_path, folder_name)
-            if not os.path.isdir(folder_path):
-                continue
+        for folder in folders:
+            folder_name = folder.name
 
-            actions = []
-            for file in os.listdir(folder_path):
-                if file in ignore_list:
-                    continue
-                if file.endswith(".cshtml") and not file.endswith(".cshtml.cs") and not file.startswith("_"):
-                    action_name = os.path.splitext(file)[0]
-                    actions.append(action_name)
+            with os.scandir(folder.path) as it:
+                actions = [os.path.splitext(e.name)[0] for e in it
+                           if e.name not in ignore_list
+                           and e.name.endswith(".cshtml") and not e.name.endswith(".cshtml.cs")
+                           and not e.name.startswith("_")]
 
             if actions:
                 controller_file_path = os.path.join(self.project_controllers_path, f"{folder_name}Controller.cs")
@@ -337,16 +487,14 @@ namespace {self.project_name}.Controllers
                     continue
 
                 # Read the original partial's content
-                with open(source_file, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = source_file.read_text(encoding="utf-8")
 
                 # Process its content for nested includes.
                 # We pass an empty list because partials should not set the page's ViewBag.
                 processed_content, _ = self._process_includes(content, [])
 
-                # Also clean asset paths within the partial
-                processed_content = clean_relative_asset_paths(processed_content)
-                processed_content = self._replace_html_links(processed_content, current_source_dir=source_file.parent)
+                # Also clean asset paths and convert links within the partial
+                processed_content = self._rewrite_urls(processed_content, current_source_dir=source_file.parent)
 
                 # Determine the new _PascalCase.cshtml filename
                 pascal_stem = to_pascal_case(source_file.stem)
@@ -354,8 +502,7 @@ namespace {self.project_name}.Controllers
                 destination_file = self.project_partials_path / new_filename
 
                 # Write the processed content to the new file
-                with open(destination_file, "w", encoding="utf-8") as f:
-                    f.write(processed_content)
+                destination_file.write_text(processed_content, encoding="utf-8")
 
     def _replace_partial_variables(self):
         """
@@ -363,8 +510,6 @@ namespace {self.project_name}.Controllers
         Skips control/directive tokens like @@if and @@include.
         """
         count = 0
-        pattern = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
-
         for file in self.project_partials_path.rglob(f"*{MVC_EXTENSION}"):
             if not file.is_file():
                 continue
@@ -373,7 +518,7 @@ namespace {self.project_name}.Controllers
             except (UnicodeDecodeError, OSError):
                 continue
 
-            new_content = pattern.sub(r'@\1', content)
+            new_content = _VAR_RE.sub(r'@\1', content)
             if new_content != content:
                 file.write_text(new_content, encoding="utf-8")
                 Log.updated(str(file))
@@ -386,7 +531,7 @@ namespace {self.project_name}.Controllers
         """Generate normalized variants of a filename with -/_ permutations"""
         stem, ext = Path(fname).stem, Path(fname).suffix
         # Split on both - and _
-        parts = re.split(r'[-_]+', stem)
+        parts = _TOKEN_SPLIT_RE.split(stem)
 
         variants = set()
 
@@ -403,20 +548,15 @@ namespace {self.project_name}.Controllers
 
         return [parent / (v + ext) for v in variants]
 
-    def _tokenize(self, stem: str) -> tuple[str, ...]:
-        # split on both '-' and '_', lowercase for stable compare
-        return tuple(t for t in re.split(r'[-_]+', stem.lower()) if t)
-
     def _build_file_index(self):
-        """Cache a list of (path, stem, tokens) for all *.html under source_path."""
-        if hasattr(self, "_file_index"):
+        """Cache all *.html under source_path, grouped by the tokens of their stem."""
+        if hasattr(self, "_token_index"):
             return
-        self._file_index = []
-        for f in self.source_path.rglob("*.html"):
-            if f.is_file():
-                stem = f.stem
-                toks = self._tokenize(stem)
-                self._file_index.append((f, stem, toks))
+        self._token_index = {}
+        self._resolve_cache = {}
+        self._resolved_dirs = {}
+        for f in _iter_html(self.source_path):
+            self._token_index.setdefault(_tokenize(f.stem), []).append(f)
 
     def _find_matching_file_strict(self, href_name: str, preferred_dir: Path | None = None) -> Path | None:
         """
@@ -427,23 +567,72 @@ namespace {self.project_name}.Controllers
         """
         self._build_file_index()
         link_stem = Path(href_name).stem
-        link_tokens = self._tokenize(link_stem)
+        link_tokens = _tokenize(link_stem)
         if not link_tokens:
             return None
 
-        candidates = [(p, stem, toks) for (p, stem, toks) in self._file_index if toks == link_tokens]
-        if not candidates:
-            return None
-
-        if preferred_dir is not None:
-            same_dir = [p for (p, _, _) in candidates if p.parent.resolve() == preferred_dir.resolve()]
-            if same_dir:
-                return same_dir[0]
-
-        # otherwise just return the first exact-token match
-        return candidates[0][0]
-
-    def _replace_html_links(self, content: str, current_source_dir=None) -> str:
+        # The same navbar/sidebar links come back on nearly every page
+        cache_key = (link_tokens, preferred_dir)
+        if cache_key in self._resolve_cache:
+            return self._resolve_cache[cache_key]
+
+        candidates = self._token_index.get(link_tokens)
+        matched = None
+        if candidates:
+            if preferred_dir is not None:
+                preferred_resolved = self._resolved_dir(preferred_dir)
+                same_dir = [p for p in candidates if self._resolved_dir(p.parent) == preferred_resolved]
+                if same_dir:
+                    matched = same_dir[0]
+
+            # otherwise just return the first exact-token match
+            if matched is None:
+                matched = candidates[0]
+
+        self._resolve_cache[cache_key] = matched
+        return matched
+
+    def _resolved_dir(self, directory: Path) -> Path:
+        """Path.resolve() hits the filesystem, so each directory is resolved only once."""
+        resolved = self._resolved_dirs.get(directory)
+        if resolved is None:
+            resolved = self._resolved_dirs[directory] = directory.resolve()
+        return resolved
+
+    def _rewrite_urls(self, content: str, current_source_dir=None) -> str:
+        """
+        Cleans relative asset paths (see clean_relative_asset_paths) and turns static .html
+        links into Razor @Url.Action(...) calls in a single pass over the content: every
+        src/href value is visited once and both rewrites are applied to it in that order.
+        """
+        anchor_hrefs = _anchor_href_starts(content)
+
+        def rewrite(match):
+            attr = match.group(1)
+            value_group = match.lastindex  # whichever quoting the value used
+            value = match.group(value_group)
+            quoted = value_group != 4
+            head_end = match.start(value_group) - quoted - match.start()
+            head, value_text = match.group(0)[:head_end], match.group(0)[head_end:]
+
+            # Asset paths: quoted, non-empty src/href values, rewritten double-quoted
+            if quoted and value and attr in ("src", "href"):
+                cleaned = clean_asset_path(value.strip())
+                if cleaned is not None:
+                    value = cleaned
+                    head, value_text = f'{attr}=', f'"{cleaned}"'
+
+            # Links: the href of an <a> tag, emitted unquoted the way Razor expects it
+            if match.start() in anchor_hrefs:
+                razor = self._html_link_to_razor(value, current_source_dir)
+                if razor:
+                    return head + razor
+
+            return head + value_text
+
+        return _URL_ATTR_RE.sub(rewrite, content)
+
+    def _html_link_to_razor(self, href: str, current_source_dir=None) -> str | None:
         """
         Replace static .html links with Razor @Url.Action(...) according to:
           - '-' = folder/segment separator (Area / Controller / Action)
@@ -451,53 +640,37 @@ namespace {self.project_name}.Controllers
         Strict filename matching by tokens (split on '-' and '_'):
           - 'auth-sign-in.html' == 'auth-sign_in.html'   ✅
           - 'calendar.html'     != 'apps-calendar.html'  ❌
-        Also emits href without quotes: href=@Url.Action("Action","Controller")
+        Returns None for links that are left as they are.
         """
-        soup = BeautifulSoup(content, "html.parser")
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href")
-            if (not href or
-                    not href.endswith(".html") or
-                    href.startswith(("#", "javascript:", "http"))):
-                continue
-
-            clean_href = href.strip().lstrip('/')
-            fname = Path(clean_href).name  # match by filename only
-
-            matched_path = self._find_matching_file_strict(fname, preferred_dir=current_source_dir)
-            if not matched_path:
-                Log.warning(f"Skipping link conversion for '{href}'. Source file not found.")
-                continue
-
-            matched_base = matched_path.stem  # e.g., "maps-leaflet" or "auth-sign_in"
-
-            # '-' define segments (Area / Controller / Action). Keep '_' inside segments.
-            segments = [s for s in matched_base.split('-') if s]
-            n = len(segments)
-
-            def P(seg: str) -> str:
-                # your _to_pascal_case already splits underscores/camelCase -> PascalCase
-                return to_pascal_case(seg)
-
-            if n == 1:
-                controller, action = P(segments[0]), "Index"
-                razor = f'@Url.Action("{action}", "{controller}")'
-            elif n == 2:
-                controller, action = P(segments[0]), P(segments[1])
-                razor = f'@Url.Action("{action}", "{controller}")'
-            else:
-                area, controller, action = P(segments[0]), P(segments[-2]), P(segments[-1])
-                razor = f'@Url.Action("{action}", "{controller}", new {{ area = "{area}" }})'
-
-            # set attribute (BeautifulSoup will quote it; we strip quotes later)
-            link["href"] = razor
+        if (not href or
+                not href.endswith(".html") or
+                href.startswith(("#", "javascript:", "http"))):
+            return None
 
-        html = str(soup)
+        clean_href = href.strip().lstrip('/')
+        fname = Path(clean_href).name  # match by filename only
 
-        # Strip quotes only when href starts with @Url.Action(...)
-        # Handle both single- and double-quoted cases safely.
-        html = re.sub(r'href=\'(@Url\.Action\([^\']*\))\'', r'href=\1', html)
-        html = re.sub(r'href="(@Url\.Action\([^"]*\))"', r'href=\1', html)
+        matched_path = self._find_matching_file_strict(fname, preferred_dir=current_source_dir)
+        if not matched_path:
+            Log.warning(f"Skipping link conversion for '{href}'. Source file not found.")
+            return None
 
-        return html
+        matched_base = matched_path.stem  # e.g., "maps-leaflet" or "auth-sign_in"
+
+        # '-' define segments (Area / Controller / Action). Keep '_' inside segments.
+        segments = [s for s in matched_base.split('-') if s]
+        n = len(segments)
+
+        def P(seg: str) -> str:
+            # your _to_pascal_case already splits underscores/camelCase -> PascalCase
+            return to_pascal_case(seg)
+
+        if n == 1:
+            controller, action = P(segments[0]), "Index"
+            return f'@Url.Action("{action}", "{controller}")'
+        elif n == 2:
+            controller, action = P(segments[0]), P(segments[1])
+            return f'@Url.Action("{action}", "{controller}")'
+        else:
+            area, controller, action = P(segments[0]), P(segments[-2]), P(segments[-1])
+            return f'@Url.Action("{action}", "{controller}", new {{ area = "{area}" }})'
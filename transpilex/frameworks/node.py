@@ -1,19 +1,94 @@
+import os
 import re
 import json
 import ast
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import re2  # google-re2: linear-time matching, no catastrophic backtracking
+except ImportError:
+    re2 = None
+
 from transpilex.config.base import NODE_ASSETS_FOLDER, NODE_DESTINATION_FOLDER, NODE_EXTENSION, NODE_GULP_ASSETS_PATH, \
     FILENAME_PRIORITY, TITLE_KEYS
 from transpilex.helpers import change_extension_and_copy, copy_assets
 from transpilex.helpers.gulpfile import add_gulpfile
 from transpilex.helpers.plugins_file import plugins_file
-from transpilex.helpers.clean_relative_asset_paths import clean_relative_asset_paths
+from transpilex.helpers.fused_postprocess import fused_postprocess
 from transpilex.helpers.logs import Log
-from transpilex.helpers.replace_html_links import replace_html_links
 from transpilex.helpers.package_json import sync_package_json
 from transpilex.helpers.validations import folder_exists
 
+# An @@include with its path (group 1, without any .html/.htm extension) and an optional
+# data block, which is discarded. Like the meta pattern below it is kept on a single line
+# without flags so it compiles with both re2 and re
+_INCLUDE_PATTERN = r"""@@include\(['"]([\s\S]+?)(?:\.html?)?['"]\s*(?:,\s*\{[\s\S]*?\}\s*)?\)"""
+# An @@include with its file path and the data object string
+_META_INCLUDE_PATTERN = r"""@@include\(\s*['"](?P<path>[\s\S]*?)['"]\s*,\s*(?P<data_str>\{[\s\S]*?\})\s*\)\s*"""
+
+_INCLUDE_RE = re2.compile(_INCLUDE_PATTERN) if re2 else re.compile(_INCLUDE_PATTERN)
+_META_INCLUDE_RE = re2.compile(_META_INCLUDE_PATTERN) if re2 else re.compile(_META_INCLUDE_PATTERN)
+_PARTIAL_VAR_RE = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
+# Position of each partial in FILENAME_PRIORITY, for constant-time lookups
+_FILENAME_RANK = {name: i for i, name in enumerate(FILENAME_PRIORITY)}
+
+# Threads for the per-file passes, which mostly wait on file reads and writes
+_WORKERS = (os.cpu_count() or 1) * 2
+
+
+def _iter_files(root, suffixes):
+    """
+    Yields every file under root whose name ends with one of suffixes, as a Path, in
+    rglob order (a folder's own files before its subfolders), reading entry types from
+    the directory listing instead of stat-ing every path.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    subdirs = []
+    with it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.name.endswith(suffixes) and e.is_file():
+                yield Path(e.path)
+    for subdir in subdirs:
+        yield from _iter_files(subdir, suffixes)
+
+
+def _meta_from_data(data_str: str) -> dict | None:
+    """
+    Parses an @@include data block and returns it with whitespace in its string values
+    collapsed, or None if it cannot be parsed or has none of the TITLE_KEYS.
+    """
+    # Most data blocks are plain JSON, which json parses far faster than
+    # literal_eval; Python-style literals (single quotes etc.) fall back to it
+    try:
+        data = json.loads(data_str)
+    except ValueError:
+        try:
+            data = ast.literal_eval(data_str)
+        except (ValueError, SyntaxError):
+            return None
+
+    # Check if at least one of the known title keys exists.
+    if not any(key in data for key in TITLE_KEYS):
+        return None
+
+    # clean ALL values and return the whole dictionary.
+    cleaned_data = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            # Collapse whitespace (like newlines) into a single space
+            cleaned_data[key] = ' '.join(value.split())
+        else:
+            # Keep non-string values (numbers, booleans) as-is
+            cleaned_data[key] = value
+    return cleaned_data
+
 
 class NodeConverter:
     def __init__(self, project_name: str, source_path: str, assets_path: str, include_gulp: bool = True):
@@ -28,6 +103,12 @@ class NodeConverter:
         self.project_views_path = Path(self.project_root / "views")
         self.project_routes_path = Path(self.project_root / "routes")
 
+        # Route meta of each top-level view, filled in by _convert from the original markup
+        self._meta_cache: dict[str, dict] = {}
+        # Converted text by digest of the original, so duplicated views and partials are
+        # rewritten once. Worker threads may race to fill an entry, which only repeats work
+        self._transform_cache: dict[bytes, str] = {}
+
 
 
         self.create_project()
@@ -48,10 +129,10 @@ class NodeConverter:
 
         change_extension_and_copy(NODE_EXTENSION, self.source_path, self.project_views_path)
 
-        self._create_routes()
-
         self._convert()
 
+        self._create_routes()
+
         self._replace_partial_variables()
 
         self._create_app_js()
@@ -83,87 +164,87 @@ class NodeConverter:
         """
         count = 0
 
-        def strip_extension(path):
-            """
-            Strip .html or .htm extension from a path string
-            """
-            return re.sub(r'\.html?$', '', path)
-
-        for file in self.project_views_path.rglob("*"):
-            if file.is_file() and file.suffix in ['.html', '.ejs']:
-                original = file.read_text(encoding="utf-8")
-                content = original
-
-                # expression finds an @@include, captures the path (group 1),
-                # and optionally matches (and discards) a data block.
-                content = re.sub(
-                    r"@@include\(['\"](.+?)['\"]\s*(?:,\s*\{.*?\}\s*)?\)",
-                    lambda m: f"<%- include('{strip_extension(m.group(1))}') %>",
-                    content,
-                    flags=re.DOTALL
-                )
-
-                content = replace_html_links(content, '')
-                content = clean_relative_asset_paths(content)
-
-                if content != original:
-                    file.write_text(content, encoding="utf-8")
+        files = list(_iter_files(self.project_views_path, ('.html', '.ejs')))
+
+        # Files are independent and the work is mostly I/O, so threads overlap it; logging
+        # waits for the results so it keeps the walk's order
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            for file, (converted, meta) in zip(files, executor.map(self._convert_file, files)):
+                if meta is not None:
+                    self._meta_cache[file.stem] = meta
+                if converted:
                     Log.converted(str(file))
                     count += 1
 
         Log.info(f"{count} files converted in {self.project_views_path}")
 
-    def _extract_meta(self, content: str):
+    def _convert_file(self, file: Path) -> tuple[bool, dict | None]:
+        """
+        Converts one view in place. Returns whether it was written, plus the route meta of
+        a top-level .ejs view (None for any other file).
+        """
+        original = file.read_text(encoding="utf-8")
+
+        # Routes need the @@include data, which the conversion below rewrites away
+        meta = None
+        if file.suffix == NODE_EXTENSION and file.parent == self.project_views_path:
+            meta = self._extract_meta(original)
+
+        # Nothing to rewrite without an include, a link/form target or an asset path
+        if ("@@include" not in original and "href" not in original
+                and "src" not in original and "action=" not in original):
+            return False, meta
+
+        digest = hashlib.blake2b(original.encode("utf-8"), digest_size=16).digest()
+        content = self._transform_cache.get(digest)
+        if content is None:
+            # expression finds an @@include, captures the path (group 1),
+            # and optionally matches (and discards) a data block.
+            content = _INCLUDE_RE.sub(r"<%- include('\1') %>", original)
+
+            # Link conversion and asset path cleanup in a single scan
+            content = fused_postprocess(content, '')
+            self._transform_cache[digest] = content
+
+        if content != original:
+            file.write_text(content, encoding="utf-8")
+            return True, meta
+        return False, meta
+
+    def _extract_meta(self, content: str) -> dict:
         """
         Extracts metadata from the highest-priority @@include statement in the content.
         Now returns the entire cleaned data object.
         """
-        # The first part of the function (pattern, matches, sorting) remains the same.
-        pattern = re.compile(
-            r"""@@include\(\s*
-                ['"](?P<path>.*?)['"]\s*,\s* # Capture the file path
-                (?P<data_str>\{.*?\})\s* # Capture the data object string
-                \)\s*""",
-            re.VERBOSE | re.DOTALL
-        )
-
-        matches = list(pattern.finditer(content))
-        if not matches:
+        # The meta pattern needs both literals; most views have no data-bearing include
+        if '@@include' not in content or '{' not in content:
             return {}
 
-        def get_priority(match):
+        def get_priority(match) -> int:
             path = match.group('path').split('/')[-1]
-            try:
-                return FILENAME_PRIORITY.index(path)
-            except ValueError:
-                return len(FILENAME_PRIORITY)
-
-        matches.sort(key=get_priority)
-
-        # Process matches in order of priority
-        for match in matches:
-            data_str = match.group('data_str')
-            try:
-                data = ast.literal_eval(data_str)
-            except (ValueError, SyntaxError):
-                continue
+            return _FILENAME_RANK.get(path, len(FILENAME_PRIORITY))
+
+        # Usually the highest-priority include (the first one on ties) carries the title,
+        # so find it in one pass instead of sorting every match
+        best = min(_META_INCLUDE_RE.finditer(content), key=get_priority, default=None)
+        if best is None:
+            return {}
 
-            # Check if at least one of the known title keys exists.
-            if any(key in data for key in TITLE_KEYS):
-                # clean ALL values and return the whole dictionary.
-                cleaned_data = {}
-                for key, value in data.items():
-                    if isinstance(value, str):
-                        # Collapse whitespace (like newlines) into a single space
-                        cleaned_data[key] = ' '.join(value.split())
-                    else:
-                        # Keep non-string values (numbers, booleans) as-is
-                        cleaned_data[key] = value
-                return cleaned_data
+        meta = _meta_from_data(best.group('data_str'))
+        if meta is not None:
+            return meta
+
+        # Otherwise process the remaining matches in order of priority
+        for match in sorted(_META_INCLUDE_RE.finditer(content), key=get_priority):
+            if match.start() == best.start():
+                continue
+            meta = _meta_from_data(match.group('data_str'))
+            if meta is not None:
+                return meta
 
         return {}
 
-    def _add_route(self, file_name, meta):
+    def _add_route(self, file_name: str, meta: dict) -> str:
         """
         Generates a route that passes the entire meta object to the template.
         """
@@ -173,16 +254,10 @@ class NodeConverter:
         render_line = f"    res.render('{file_name}'"
 
         if meta:
-            js_object_parts = []
-            for key, value in meta.items():
-                # Use json.dumps to safely convert the Python value to a
-                # JavaScript-compatible value string. It handles quotes, booleans, etc.
-                js_value = json.dumps(value)
-                js_object_parts.append(f"{key}: {js_value}")
-
-            # Join all the key: value pairs with commas
-            js_object_string = ", ".join(js_object_parts)
-            render_line += f", {{ {js_object_string} }}"
+            # A JSON object is a valid JavaScript object literal, so one json.dumps call
+            # converts the whole meta, quoting keys (even ones like "page-title") and
+            # handling string escapes, booleans, etc.
+            render_line += f", {json.dumps(meta)}"
 
         render_line += ");"
         route += render_line + "\n});\n"
@@ -198,28 +273,23 @@ class NodeConverter:
 
         route_file = self.project_routes_path / 'index.js'
 
-        routes = [
-            "const express = require('express');",
-            "const route = express.Router();\n"
-        ]
-
         skipped = []
 
-        for file in self.project_views_path.glob("*.ejs"):
-            content = file.read_text(encoding="utf-8")
-            file_name = file.stem
-            meta = self._extract_meta(content)
+        # Each route is written as it is generated rather than joined into one string first
+        with open(route_file, "w", encoding="utf-8") as f:
+            f.write("const express = require('express');\n")
+            f.write("const route = express.Router();\n")
 
-            if not any(key in meta for key in TITLE_KEYS):
-                Log.warning(f"Skipping: {file_name}.ejs as no title key found")
-                skipped.append(file_name)
-                continue
+            for file_name, meta in self._meta_cache.items():
+                if not any(key in meta for key in TITLE_KEYS):
+                    Log.warning(f"Skipping: {file_name}.ejs as no title key found")
+                    skipped.append(file_name)
+                    continue
 
-            route_code = self._add_route(file_name, meta)
-            routes.append(route_code)
+                f.write("\n")
+                f.write(self._add_route(file_name, meta))
 
-        routes.append("\nmodule.exports = route;")
-        route_file.write_text("\n".join(routes), encoding="utf-8")
+            f.write("\n\nmodule.exports = route;")
 
         Log.created(f"route.js at {self.project_routes_path}")
         if skipped:
@@ -265,21 +335,28 @@ http.listen(port, () => {
 
     def _replace_partial_variables(self):
         count = 0
-        pattern = re.compile(r'@@(?!if\b|include\b)([A-Za-z_]\w*)\b')
 
-        for file in self.project_views_path.rglob(f"*{NODE_EXTENSION}"):
-            if not file.is_file():
-                continue
-            try:
-                content = file.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
-                continue
-
-            new_content = pattern.sub(r'<%- \1 %>', content)
-            if new_content != content:
-                file.write_text(new_content, encoding="utf-8")
-                Log.updated(str(file))
-                count += 1
+        files = list(_iter_files(self.project_views_path, NODE_EXTENSION))
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            for file, updated in zip(files, executor.map(self._replace_file_variables, files)):
+                if updated:
+                    Log.updated(str(file))
+                    count += 1
 
         if count:
             Log.info(f"{count} files updated in {self.project_views_path}")
+
+    def _replace_file_variables(self, file: Path) -> bool:
+        try:
+            content = file.read_text(encoding="utf-8")
+        except (UnicodeDecodeError, OSError):
+            return False
+
+        if "@@" not in content:
+            return False
+
+        new_content, replaced = _PARTIAL_VAR_RE.subn(r'<%- \1 %>', content)
+        if replaced:
+            file.write_text(new_content, encoding="utf-8")
+            return True
+        return False
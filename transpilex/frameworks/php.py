@@ -1,5 +1,7 @@
+import os
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from transpilex.helpers.plugins_file import plugins_file
@@ -7,13 +9,51 @@ from transpilex.helpers.change_extension import change_extension_and_copy
 from transpilex.helpers.copy_assets import copy_assets
 from transpilex.helpers.gulpfile import add_gulpfile
 from transpilex.helpers.logs import Log
-from transpilex.helpers.replace_html_links import replace_html_links
+from transpilex.helpers.replace_html_links import convert_html_link
 from transpilex.helpers.package_json import update_package_json
 
 from transpilex.config.base import PHP_SRC_FOLDER, PHP_EXTENSION, PHP_ASSETS_FOLDER, PHP_GULP_ASSETS_PATH, \
     PHP_DESTINATION_FOLDER
 from transpilex.helpers.validations import folder_exists
 
+# Includes with params, includes without params and href/action values, tried in that
+# order at each position so a single scan does all of _convert's rewriting
+_TEMPLATE_TOKEN_RE = re.compile(
+    r"""@@include\(\s*["'](?P<params_path>.+?)["']\s*,\s*(?P<params>\{[\s\S]*?\})\s*\)"""
+    r"""|@@include\(\s*['"](?P<path>.+?)['"]\s*\)"""
+    r"""|(?:(?<=href=['"])|(?<=action=['"]))(?P<link>[^'"]+)(?=['"])"""
+)
+# A string literal, handling escaped quotes
+_STRING_LITERAL_RE = re.compile(r'''(["'])((?:(?!\1|\\).|\\.)*)\1''', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_COMMA_RE = re.compile(r",\s*(?=[}\]])")
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+# Standalone variables: @@var, but not @@if
+_PARTIAL_VAR_RE = re.compile(r'@@(?!if\b)(\w+)')
+# Threads for the per-file passes, which mostly wait on file reads and writes
+_WORKERS = (os.cpu_count() or 1) * 2
+
+
+def _iter_files(root, suffixes):
+    """
+    Yields every file under root whose name ends with one of suffixes, as a Path, in
+    rglob order (a folder's own files before its subfolders), reading entry types from
+    the directory listing instead of stat-ing every path.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    subdirs = []
+    with it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                subdirs.append(e.path)
+            elif e.name.endswith(suffixes) and e.is_file():
+                yield Path(e.path)
+    for subdir in subdirs:
+        yield from _iter_files(subdir, suffixes)
+
 
 class PHPConverter:
 
@@ -66,89 +106,96 @@ class PHPConverter:
         count = 0
 
         # Iterate only destination files (*.php)
-        for file in self.project_src_path.rglob(f"*{PHP_EXTENSION}"):
-            if not file.is_file():
-                continue
+        files = list(_iter_files(self.project_src_path, PHP_EXTENSION))
 
-            # Read as UTF-8; silently skip if binary/non-UTF8
-            try:
-                with open(file, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except (UnicodeDecodeError, OSError):
-                continue
-
-            original_content = content
-
-            # Only work if includes or .html links are present
-            if "@@include" not in content and ".html" not in content:
-                continue
-
-            def to_php_path(path: str) -> str:
-                return path[:-5] + PHP_EXTENSION if path.endswith(".html") else path + PHP_EXTENSION
-
-            # Replace includes WITH parameters (allow missing .html)
-            def include_with_params(match):
-                path = match.group(1).strip()
-                json_str = match.group(2)
-
-                # finds any sequence of whitespace (newlines, tabs, spaces)
-                # inside a string literal and replaces it with a single space.
-                def collapse_whitespace_in_strings(m):
-                    quote_char = m.group(1)
-                    string_content = m.group(2)
-                    # Replace any sequence of 1+ whitespace chars with a single space
-                    cleaned_content = re.sub(r'\s+', ' ', string_content).strip()
-                    return quote_char + cleaned_content + quote_char
-
-                # This regex correctly finds string literals, handling escaped quotes.
-                string_literal_regex = r'''(["'])((?:(?!\1|\\).|\\.)*)\1'''
-                json_str = re.sub(string_literal_regex, collapse_whitespace_in_strings, json_str, flags=re.DOTALL)
-
-                fixed_json_str = re.sub(r",\s*(?=[}\]])", "", json_str)
-                fixed_json_str = re.sub(r"'([^']*)'", r'"\1"', fixed_json_str)
-
-                try:
-                    params = json.loads(fixed_json_str)
-                    php_vars = ''.join([f"${k} = {json.dumps(v)}; " for k, v in params.items()])
-                    php_path = to_php_path(path)
-                    return f"<?php {php_vars}include('{php_path}'); ?>"
-                except json.JSONDecodeError as e:
-                    Log.warning(f"[JSON Error] in file {file.name}: {e}")
-                    return match.group(0)
-
-            # Replace includes WITHOUT parameters (allow missing .html)
-            def include_without_params(m):
-                path = m.group(1).strip()
-                return f"<?php include('{to_php_path(path)}'); ?>"
-
-            # Do replacements
-            content = re.sub(
-                r"""@@include\(\s*["'](.+?)["']\s*,\s*(\{[\s\S]*?\})\s*\)""",
-                include_with_params,
-                content
-            )
-
-            content = re.sub(
-                r"""@@include\(\s*['"](.+?)['"]\s*\)""",
-                include_without_params,
-                content
-            )
+        # Files are independent and the work is mostly I/O, so threads overlap it; the
+        # messages are replayed afterwards so the log keeps the walk's order
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            for converted, logs in executor.map(self._convert_file, files):
+                for log, message in logs:
+                    log(message)
+                count += converted
+
+        Log.info(f"{count} files converted in {self.project_src_path}")
+
+    def _convert_file(self, file: Path) -> tuple[bool, list]:
+        """
+        Converts one PHP file in place. Returns whether it was written, plus the
+        (Log method, message) pairs it produced.
+        """
+        logs = []
+
+        # Read as UTF-8; silently skip if binary/non-UTF8
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (UnicodeDecodeError, OSError):
+            return False, logs
+
+        original_content = content
+
+        # Only work if includes or .html links are present
+        if "@@include" not in content and ".html" not in content:
+            return False, logs
+
+        def to_php_path(path: str) -> str:
+            return path[:-5] + PHP_EXTENSION if path.endswith(".html") else path + PHP_EXTENSION
+
+        # Replace includes WITH parameters (allow missing .html)
+        def include_with_params(match) -> str:
+            path = match.group("params_path").strip()
+            json_str = match.group("params")
+
+            # finds any sequence of whitespace (newlines, tabs, spaces)
+            # inside a string literal and replaces it with a single space.
+            def collapse_whitespace_in_strings(m):
+                quote_char = m.group(1)
+                string_content = m.group(2)
+                # Replace any sequence of 1+ whitespace chars with a single space
+                cleaned_content = _WHITESPACE_RE.sub(' ', string_content).strip()
+                return quote_char + cleaned_content + quote_char
+
+            json_str = _STRING_LITERAL_RE.sub(collapse_whitespace_in_strings, json_str)
+
+            fixed_json_str = _TRAILING_COMMA_RE.sub("", json_str)
+            fixed_json_str = _SINGLE_QUOTED_RE.sub(r'"\1"', fixed_json_str)
 
+            try:
+                params = json.loads(fixed_json_str)
+                php_vars = ''.join([f"${k} = {json.dumps(v)}; " for k, v in params.items()])
+                php_path = to_php_path(path)
+                return f"<?php {php_vars}include('{php_path}'); ?>"
+            except json.JSONDecodeError as e:
+                logs.append((Log.warning, f"[JSON Error] in file {file.name}: {e}"))
+                return match.group(0)
+
+        # Replace includes WITHOUT parameters (allow missing .html)
+        def include_without_params(m) -> str:
+            path = m.group("path").strip()
+            return f"<?php include('{to_php_path(path)}'); ?>"
+
+        def replace_token(m) -> str:
+            if m.group("params") is not None:
+                return include_with_params(m)
+            if m.group("path") is not None:
+                return include_without_params(m)
             # Replace anchor .html links with .php equivalents
-            content = replace_html_links(content, PHP_EXTENSION)
+            return convert_html_link(m.group("link"), PHP_EXTENSION)
 
-            if content != original_content:
-                try:
-                    with open(file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    Log.converted(str(file))
-                    count += 1
-                except Exception as e:
-                    Log.error(f"Failed to write {file}: {e}")
-            else:
-                Log.warning(f"File was skipped (no patterns matched): {file}")
+        # Do replacements
+        content = _TEMPLATE_TOKEN_RE.sub(replace_token, content)
 
-        Log.info(f"{count} files converted in {self.project_src_path}")
+        if content != original_content:
+            try:
+                with open(file, "w", encoding="utf-8") as f:
+                    f.write(content)
+                logs.append((Log.converted, str(file)))
+                return True, logs
+            except Exception as e:
+                logs.append((Log.error, f"Failed to write {file}: {e}"))
+        else:
+            logs.append((Log.warning, f"File was skipped (no patterns matched): {file}"))
+        return False, logs
 
     def _replace_partial_variables(self):
         """
@@ -157,26 +204,31 @@ class PHPConverter:
         """
 
         count = 0
-        for file in self.project_partials_path.rglob(f"*{PHP_EXTENSION}"):
-            if not file.is_file():
-                continue
+        files = list(_iter_files(self.project_partials_path, PHP_EXTENSION))
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            for file, updated in zip(files, executor.map(self._replace_file_variables, files)):
+                if updated:
+                    Log.updated(str(file))
+                    count += 1
 
-            try:
-                with open(file, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except (UnicodeDecodeError, OSError):
-                continue
+        if count > 0:
+            Log.info(f"{count} files updated in {self.project_partials_path}")
 
-            original_content = content
+    def _replace_file_variables(self, file: Path) -> bool:
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (UnicodeDecodeError, OSError):
+            return False
 
-            # Replace standalone variables: @@var, but ignore @@if
-            content = re.sub(r'@@(?!if\b)(\w+)', r'<?php echo ($\1); ?>', content)
+        if "@@" not in content:
+            return False
 
-            if content != original_content:
-                with open(file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                Log.updated(str(file))
-                count += 1
+        # Replace standalone variables: @@var, but ignore @@if
+        content, replaced = _PARTIAL_VAR_RE.subn(r'<?php echo ($\1); ?>', content)
 
-        if count > 0:
-            Log.info(f"{count} files updated in {self.project_partials_path}")
+        if replaced:
+            with open(file, "w", encoding="utf-8") as f:
+                f.write(content)
+            return True
+        return False
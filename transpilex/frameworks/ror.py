@@ -18,7 +18,7 @@ from transpilex.helpers.validations import folder_exists
 
 
 class RoRConverter:
-    def __init__(self, project_name: str, source_path: str, assets_path: str):
+    def __init__(self, project_name: str, source_path: str, assets_path: str, use_hardlinks: bool = True):
         self.project_name = project_name
         self.source_path = Path(source_path)
         self.destination_path = Path(ROR_DESTINATION_FOLDER)
@@ -31,6 +31,8 @@ class RoRConverter:
         self.project_controllers_path = Path(self.project_root / "app" / "controllers")
         self.project_routes_path = self.project_root / "config" / "routes.rb"
 
+        self.use_hardlinks = use_hardlinks
+
         self.create_project()
 
     def create_project(self):
@@ -71,7 +73,7 @@ class RoRConverter:
         self._create_controllers(ignore_list=["layouts", "partials"])
 
         public_only = copy_assets_in_public(self.assets_path, Path(self.project_root / "public"),
-                                            ["media", "data", "json"])
+                                            ["media", "data", "json"], use_hardlinks=self.use_hardlinks)
 
         copy_assets(
             self.assets_path,
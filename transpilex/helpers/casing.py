@@ -1,6 +1,8 @@
 import re
+from functools import lru_cache
 
 
+@lru_cache(maxsize=2048)
 def to_pascal_case(s: str):
     # First split on _ - and spaces
     parts = re.split(r"[_\-\s]+", s)
@@ -1,4 +1,12 @@
 import re
+from functools import lru_cache
+
+_EXTERNAL_PATH_RE = re.compile(r'^(?:[a-z]+:)?//|^[\w.-]+\.\w+/')
+_ASSETS_PREFIX_RE = re.compile(r'^(\.{0,2}/)*assets')
+_ASSET_ATTR_RE = re.compile(r'\b(src|href)\s*=\s*["\']([^"\']+)["\']')
+
+# Only strings up to this length are memoized, which bounds the cache's memory
+_CACHE_MAX_LEN = 4096
 
 
 def clean_relative_asset_paths(content: str) -> str:
@@ -7,18 +15,38 @@ def clean_relative_asset_paths(content: str) -> str:
     - Removes leading 'assets/', '../assets/', '..assets/' etc. from local paths
     - Does NOT modify URLs containing 'assets/' in the middle (like external CDNs)
     """
+    # Short inputs such as the styles/scripts sections repeat across most pages
+    if len(content) <= _CACHE_MAX_LEN:
+        return _clean_cached(content)
+    return _clean(content)
+
+
+def clean_asset_path(path: str) -> str | None:
+    """
+    Cleans a single src/href value (already stripped), or returns None for an external
+    URL that must be left exactly as written.
+    """
+    # Skip if it contains :// or starts like cdn.domain.com
+    if _EXTERNAL_PATH_RE.match(path):
+        return None
+
+    # Clean if path starts with relative asset path
+    return _ASSETS_PREFIX_RE.sub('', path)
+
+
+def _clean(content: str) -> str:
 
     def clean_match(match):
         attr = match.group(1)
-        path = match.group(2).strip()
-
-        # Skip if it contains :// or starts like cdn.domain.com
-        if re.match(r'^(?:[a-z]+:)?//|^[\w.-]+\.\w+/', path):
+        cleaned = clean_asset_path(match.group(2).strip())
+        if cleaned is None:
             return match.group(0)
-
-        # Clean if path starts with relative asset path
-        cleaned = re.sub(r'^(\.{0,2}/)*assets', '', path)
         return f'{attr}="{cleaned}"'
 
     # Clean both href="..." and src="..."
-    return re.sub(r'\b(src|href)\s*=\s*["\']([^"\']+)["\']', clean_match, content)
+    return _ASSET_ATTR_RE.sub(clean_match, content)
+
+
+@lru_cache(maxsize=2048)
+def _clean_cached(content: str) -> str:
+    return _clean(content)
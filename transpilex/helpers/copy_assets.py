@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -49,8 +50,24 @@ def copy_assets(source_path: Path, destination_path: Path, preserve=None, exclud
         Log.copied(f"{item} → {target}")
 
 
+def _link_or_copy(src, dst):
+    """
+    Hardlinks src to dst so no file data is copied, falling back to a real copy
+    where links are not possible (e.g. across devices or on FAT filesystems).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def copy_assets_in_public(source_assets_path: Path, destination_path: Path,
-                          candidates=None):
+                          candidates=None, use_hardlinks: bool = True):
+    """
+    Copies the public-only asset folders. With use_hardlinks the files are hardlinked
+    to the source, so editing one in place also edits the other.
+    """
     if candidates is None:
         candidates = ["images", "img", "media", "data", "json"]
 
@@ -64,7 +81,7 @@ def copy_assets_in_public(source_assets_path: Path, destination_path: Path,
             dest = destination_path / name
             if dest.exists():
                 shutil.rmtree(dest)
-            shutil.copytree(src, dest)
+            shutil.copytree(src, dest, copy_function=_link_or_copy if use_hardlinks else shutil.copy2)
             copied.add(name)
             Log.copied(f"{src} → {dest}")
 
@@ -0,0 +1,37 @@
+import re
+
+from transpilex.helpers.clean_relative_asset_paths import clean_asset_path
+from transpilex.helpers.replace_html_links import convert_html_link
+
+# A src/href attribute (name, the text around '=' and its value), or any other href/action
+# value that replace_html_links would rewrite, such as one in data-href="..."
+_FUSED_RE = re.compile(
+    r"""\b(src|href)(\s*=\s*)["']([^"']+)["']"""
+    r"""|(?:(?<=href=['"])|(?<=action=['"]))([^'"]+)(?=['"])"""
+)
+
+
+def fused_postprocess(content: str, new_extension: str) -> str:
+    """
+    Same result as replace_html_links(content, new_extension) followed by
+    clean_relative_asset_paths(), in a single scan of the content.
+    """
+
+    def replace_match(match):
+        attr = match.group(1)
+        if attr is None:
+            return convert_html_link(match.group(4), new_extension)
+
+        value = match.group(3)
+        # replace_html_links only sees href values written as href="..." / href='...'
+        if attr == 'href' and match.group(2) == '=':
+            value = convert_html_link(value, new_extension)
+
+        cleaned = clean_asset_path(value.strip())
+        if cleaned is None:
+            # External URLs keep their markup as written, apart from the link conversion
+            text = match.string
+            return text[match.start():match.start(3)] + value + text[match.end(3):match.end()]
+        return f'{attr}="{cleaned}"'
+
+    return _FUSED_RE.sub(replace_match, content)
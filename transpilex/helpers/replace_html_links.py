@@ -1,36 +1,42 @@
 import re
 
 
-def replace_html_links(content: str, new_extension: str) -> str:
-
-    def replace_match(match):
-        original_url = match.group(1)
-
-        if original_url.startswith(('http://', 'https://', '//', '/')):
-            if original_url.endswith(".html"):
-                temp_url_without_html = original_url.replace(".html", "")
-                if new_extension == "":
-                    return temp_url_without_html if not temp_url_without_html.endswith("/index") else "/"
-                else:
-                    return temp_url_without_html + new_extension
-            else:
-                return original_url
-
+def convert_html_link(original_url: str, new_extension: str) -> str:
+    """
+    Converts a single href/action value: a .html target gets new_extension, or becomes
+    an extensionless route when new_extension is empty. Anything else is returned as is.
+    """
+    if original_url.startswith(('http://', 'https://', '//', '/')):
         if original_url.endswith(".html"):
             temp_url_without_html = original_url.replace(".html", "")
-
             if new_extension == "":
-                processed_url_segment = temp_url_without_html if not temp_url_without_html.endswith("index") else ""
-                final_url = "/" + processed_url_segment
-                if final_url == "//":
-                    final_url = "/"
-                return final_url
+                return temp_url_without_html if not temp_url_without_html.endswith("/index") else "/"
             else:
                 return temp_url_without_html + new_extension
         else:
             return original_url
 
+    if original_url.endswith(".html"):
+        temp_url_without_html = original_url.replace(".html", "")
+
+        if new_extension == "":
+            processed_url_segment = temp_url_without_html if not temp_url_without_html.endswith("index") else ""
+            final_url = "/" + processed_url_segment
+            if final_url == "//":
+                final_url = "/"
+            return final_url
+        else:
+            return temp_url_without_html + new_extension
+    else:
+        return original_url
+
+
+def replace_html_links(content: str, new_extension: str) -> str:
+
+    def replace_match(match):
+        return convert_html_link(match.group(1), new_extension)
+
     content = re.sub(r"""(?<=href=['"])([^'"]+)(?=['"])""", replace_match, content)
     content = re.sub(r"""(?<=action=['"])([^'"]+)(?=['"])""", replace_match, content)
 
-    return content
\ No newline at end of file
+    return content
@@ -1,9 +1,11 @@
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from transpilex.helpers.logs import Log
 
 
+@lru_cache(maxsize=4096)
 def apply_casing(name, case_type):
     if case_type == "snake":
         s1 = name.replace(" ", "-").replace("_", "-")
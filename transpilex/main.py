@@ -47,6 +47,7 @@ def main():
     laravel_p = subparsers.add_parser("laravel", help="Convert to Laravel")
     add_common_framework_args(laravel_p)
     laravel_p.add_argument("--auth", action='store_true')
+    laravel_p.add_argument("--no-hardlinks", action='store_true')
 
     # cakephp
     cakephp_p = subparsers.add_parser("cakephp", help="Convert to CakePHP")
@@ -83,6 +84,7 @@ def main():
     # ror
     ror_p = subparsers.add_parser("ror", help="Convert to RoR")
     add_common_framework_args(ror_p)
+    ror_p.add_argument("--no-hardlinks", action='store_true')
 
     # spring
     spring_p = subparsers.add_parser("spring", help="Convert to Spring Boot")
@@ -168,4 +170,6 @@ def framework_specific_kwargs(args):
         kwargs['plugins_config'] = not args.no_plugins_config
     if hasattr(args, 'auth'):
         kwargs['auth'] = args.auth
+    if hasattr(args, 'no_hardlinks'):
+        kwargs['use_hardlinks'] = not args.no_hardlinks
     return kwargs